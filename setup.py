@@ -27,7 +27,6 @@ setup(
     install_requires=[
         "PyMuPDF>=1.23.0",
         "ezdxf>=1.1.0",
-        "click>=8.1.0",
         "tqdm>=4.65.0",
         "numpy>=1.24.0",
         "Pillow>=9.0.0",
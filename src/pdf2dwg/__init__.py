@@ -15,51 +15,99 @@ Key Features:
 __version__ = "1.2.0"
 __author__ = ""
 
-# Main converter
-from .converter import (
-    PDFToDWGConverter,
-    OutputFormat,
-    PageMode,
-    ConversionResult,
-    quick_convert,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Submodules pull in PyMuPDF, ezdxf and numpy, so public names are resolved
+# on first access (PEP 562) to keep `import pdf2dwg` and the CLI fast
+_LAZY_IMPORTS = {
+    # Main converter
+    "PDFToDWGConverter": ".converter",
+    "OutputFormat": ".converter",
+    "PageMode": ".converter",
+    "ConversionResult": ".converter",
+    "quick_convert": ".converter",
+    # PDF extraction
+    "PDFVectorExtractor": ".pdf_extractor",
+    "ExtractedData": ".pdf_extractor",
+    "detect_circles_and_arcs": ".pdf_extractor",
+    "detect_conics": ".pdf_extractor",
+    "detect_ellipses": ".pdf_extractor",
+    "Point": ".pdf_extractor",
+    "Line": ".pdf_extractor",
+    "Arc": ".pdf_extractor",
+    "Circle": ".pdf_extractor",
+    "Ellipse": ".pdf_extractor",
+    "Polyline": ".pdf_extractor",
+    "Spline": ".pdf_extractor",
+    "TextEntity": ".pdf_extractor",
+    "MText": ".pdf_extractor",
+    "Rectangle": ".pdf_extractor",
+    "Hatch": ".pdf_extractor",
+    "ImageEntity": ".pdf_extractor",
+    "LineType": ".pdf_extractor",
+    # DXF writing
+    "DXFWriter": ".dxf_writer",
+    "create_dxf_from_data": ".dxf_writer",
+    "merge_pages_to_dxf": ".dxf_writer",
+    # DWG conversion
+    "DWGConverter": ".dwg_converter",
+    "DWGVersion": ".dwg_converter",
+    "convert_dxf_to_dwg": ".dwg_converter",
+}
+
+if TYPE_CHECKING:
+    from .converter import (
+        PDFToDWGConverter,
+        OutputFormat,
+        PageMode,
+        ConversionResult,
+        quick_convert,
+    )
+    from .pdf_extractor import (
+        PDFVectorExtractor,
+        ExtractedData,
+        detect_circles_and_arcs,
+        detect_conics,
+        detect_ellipses,
+        Point,
+        Line,
+        Arc,
+        Circle,
+        Ellipse,
+        Polyline,
+        Spline,
+        TextEntity,
+        MText,
+        Rectangle,
+        Hatch,
+        ImageEntity,
+        LineType,
+    )
+    from .dxf_writer import (
+        DXFWriter,
+        create_dxf_from_data,
+        merge_pages_to_dxf,
+    )
+    from .dwg_converter import (
+        DWGConverter,
+        DWGVersion,
+        convert_dxf_to_dwg,
+    )
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
 
-# PDF extraction
-from .pdf_extractor import (
-    PDFVectorExtractor,
-    ExtractedData,
-    detect_circles_and_arcs,
-    detect_ellipses,
-    # Entity types
-    Point,
-    Line,
-    Arc,
-    Circle,
-    Ellipse,
-    Polyline,
-    Spline,
-    TextEntity,
-    MText,
-    Rectangle,
-    Hatch,
-    ImageEntity,
-    # Enums
-    LineType,
-)
 
-# DXF writing
-from .dxf_writer import (
-    DXFWriter,
-    create_dxf_from_data,
-    merge_pages_to_dxf,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-# DWG conversion
-from .dwg_converter import (
-    DWGConverter,
-    DWGVersion,
-    convert_dxf_to_dwg,
-)
 
 __all__ = [
     # Version
@@ -74,6 +122,7 @@ __all__ = [
     "PDFVectorExtractor",
     "ExtractedData",
     "detect_circles_and_arcs",
+    "detect_conics",
     "detect_ellipses",
     # Entity types
     "Point",
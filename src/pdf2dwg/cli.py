@@ -7,129 +7,157 @@ Usage:
     pdf2dwg input.pdf --scale 2.0 --pages 0,1,2
 """
 
+import argparse
 import os
 import sys
-import click
+import time
 from pathlib import Path
 from typing import Optional, List
 
-from .converter import PDFToDWGConverter, OutputFormat, PageMode, ConversionResult
-from .dwg_converter import DWGVersion
+# Progress bar rendering; one prebuilt string per fill level
+PROGRESS_BAR_WIDTH = 30
+PROGRESS_BARS = ["=" * i + "-" * (PROGRESS_BAR_WIDTH - i) for i in range(PROGRESS_BAR_WIDTH + 1)]
+PROGRESS_INTERVAL = 0.05  # Seconds between progress bar redraws
 
+# ANSI color codes used for status messages
+ANSI_COLORS = {
+    "red": "\033[31m",
+    "green": "\033[32m",
+    "yellow": "\033[33m",
+}
+ANSI_RESET = "\033[0m"
 
-def parse_pages(ctx, param, value) -> Optional[List[int]]:
+
+def style(text: str, fg: str, stream=None) -> str:
+    """Color text with ANSI codes when the target stream is a terminal"""
+    stream = stream or sys.stdout
+    if not stream.isatty():
+        return text
+    return f"{ANSI_COLORS[fg]}{text}{ANSI_RESET}"
+
+
+def parse_pages(value: Optional[str]) -> Optional[List[int]]:
     """Parse comma-separated page numbers"""
     if value is None:
         return None
     try:
         return [int(p.strip()) for p in value.split(",")]
     except ValueError:
-        raise click.BadParameter("Pages must be comma-separated integers (e.g., 0,1,2)")
-
-
-@click.command()
-@click.argument("input_file", type=click.Path(exists=True))
-@click.argument("output_file", type=click.Path(), required=False)
-@click.option(
-    "-o", "--output",
-    type=click.Path(),
-    help="Output file path (alternative to positional argument)"
-)
-@click.option(
-    "-f", "--format",
-    type=click.Choice(["dwg", "dxf", "both"], case_sensitive=False),
-    default="dwg",
-    help="Output format (default: dwg)"
-)
-@click.option(
-    "-s", "--scale",
-    type=float,
-    default=1.0,
-    help="Scale factor for coordinates (default: 1.0)"
-)
-@click.option(
-    "-v", "--version",
-    type=click.Choice(["ACAD2000", "ACAD2004", "ACAD2007", "ACAD2010", "ACAD2013", "ACAD2018"]),
-    default="ACAD2010",
-    help="Target DWG version (default: ACAD2010)"
-)
-@click.option(
-    "--dxf-version",
-    type=click.Choice(["R12", "R2000", "R2004", "R2007", "R2010", "R2013", "R2018"]),
-    default="R2010",
-    help="Target DXF version (default: R2010)"
-)
-@click.option(
-    "-p", "--pages",
-    callback=parse_pages,
-    help="Specific pages to convert (0-indexed, comma-separated, e.g., 0,1,2)"
-)
-@click.option(
-    "-m", "--mode",
-    type=click.Choice(["single", "separate", "merge"], case_sensitive=False),
-    default="single",
-    help="Page mode: single (first page only), separate (each page to file), merge (all in one)"
-)
-@click.option(
-    "--keep-dxf",
-    is_flag=True,
-    help="Keep intermediate DXF file when converting to DWG"
-)
-@click.option(
-    "--no-geometry-detection",
-    is_flag=True,
-    help="Disable automatic circle/arc detection from polylines"
-)
-@click.option(
-    "--oda-path",
-    type=click.Path(),
-    help="Path to ODA File Converter executable"
-)
-@click.option(
-    "-q", "--quiet",
-    is_flag=True,
-    help="Suppress progress output"
-)
-@click.version_option(version="1.0.0")
-def main(
-    input_file: str,
-    output_file: Optional[str],
-    output: Optional[str],
-    format: str,
-    scale: float,
-    version: str,
-    dxf_version: str,
-    pages: Optional[List[int]],
-    mode: str,
-    keep_dxf: bool,
-    no_geometry_detection: bool,
-    oda_path: Optional[str],
-    quiet: bool,
-):
+        raise argparse.ArgumentTypeError("Pages must be comma-separated integers (e.g., 0,1,2)")
+
+
+def existing_path(value: str) -> str:
+    """Argument type that requires the path to exist"""
+    if not os.path.exists(value):
+        raise argparse.ArgumentTypeError(f"Path '{value}' does not exist.")
+    return value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the pdf2dwg command"""
+    parser = argparse.ArgumentParser(
+        prog="pdf2dwg",
+        description="Convert PDF files to DWG/DXF format for AutoCAD.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""\
+Examples:
+    pdf2dwg drawing.pdf                    # Convert to drawing.dwg
+    pdf2dwg drawing.pdf output.dwg         # Convert to specified output
+    pdf2dwg drawing.pdf -f dxf             # Convert to DXF format
+    pdf2dwg drawing.pdf -s 2.0             # Scale by 2x
+    pdf2dwg drawing.pdf -m merge           # Merge all pages
+    pdf2dwg drawing.pdf -p 0,2,4           # Convert specific pages
+
+Requirements:
+    - For DWG output: ODA File Converter must be installed
+      Download from: https://www.opendesign.com/guestfiles/oda_file_converter
+    - For DXF output: No additional requirements
+""",
+    )
+    parser.add_argument("input_file", type=existing_path)
+    parser.add_argument("output_file", nargs="?")
+    parser.add_argument(
+        "-o", "--output",
+        help="Output file path (alternative to positional argument)"
+    )
+    parser.add_argument(
+        "-f", "--format",
+        type=str.lower,
+        choices=["dwg", "dxf", "both"],
+        default="dwg",
+        help="Output format (default: dwg)"
+    )
+    parser.add_argument(
+        "-s", "--scale",
+        type=float,
+        default=1.0,
+        help="Scale factor for coordinates (default: 1.0)"
+    )
+    parser.add_argument(
+        "-v", "--version",
+        choices=["ACAD2000", "ACAD2004", "ACAD2007", "ACAD2010", "ACAD2013", "ACAD2018"],
+        default="ACAD2010",
+        help="Target DWG version (default: ACAD2010)"
+    )
+    parser.add_argument(
+        "--dxf-version",
+        choices=["R12", "R2000", "R2004", "R2007", "R2010", "R2013", "R2018"],
+        default="R2010",
+        help="Target DXF version (default: R2010)"
+    )
+    parser.add_argument(
+        "-p", "--pages",
+        type=parse_pages,
+        help="Specific pages to convert (0-indexed, comma-separated, e.g., 0,1,2)"
+    )
+    parser.add_argument(
+        "-m", "--mode",
+        type=str.lower,
+        choices=["single", "separate", "merge"],
+        default="single",
+        help="Page mode: single (first page only), separate (each page to file), merge (all in one)"
+    )
+    parser.add_argument(
+        "--keep-dxf",
+        action="store_true",
+        help="Keep intermediate DXF file when converting to DWG"
+    )
+    parser.add_argument(
+        "--no-geometry-detection",
+        action="store_true",
+        help="Disable automatic circle/arc detection from polylines"
+    )
+    parser.add_argument(
+        "--oda-path",
+        help="Path to ODA File Converter executable"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Suppress progress output"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
     """
     Convert PDF files to DWG/DXF format for AutoCAD.
 
-    \b
-    Examples:
-        pdf2dwg drawing.pdf                    # Convert to drawing.dwg
-        pdf2dwg drawing.pdf output.dwg         # Convert to specified output
-        pdf2dwg drawing.pdf -f dxf             # Convert to DXF format
-        pdf2dwg drawing.pdf -s 2.0             # Scale by 2x
-        pdf2dwg drawing.pdf -m merge           # Merge all pages
-        pdf2dwg drawing.pdf -p 0,2,4           # Convert specific pages
-
-    \b
-    Requirements:
-        - For DWG output: ODA File Converter must be installed
-          Download from: https://www.opendesign.com/guestfiles/oda_file_converter
-        - For DXF output: No additional requirements
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
     """
+    args = build_parser().parse_args(argv)
+
+    # Imported here so --help does not load PyMuPDF and ezdxf
+    from .converter import PDFToDWGConverter, OutputFormat, PageMode
+    from .dwg_converter import DWGVersion
+
     # Determine output path
-    out_path = output or output_file
+    out_path = args.output or args.output_file
     if out_path is None:
         # Default to same name with appropriate extension
-        ext = ".dwg" if format.lower() == "dwg" else ".dxf"
-        out_path = os.path.splitext(input_file)[0] + ext
+        ext = ".dwg" if args.format == "dwg" else ".dxf"
+        out_path = os.path.splitext(args.input_file)[0] + ext
 
     # Map format string to enum
     format_map = {
@@ -137,7 +165,7 @@ def main(
         "dxf": OutputFormat.DXF,
         "both": OutputFormat.BOTH,
     }
-    output_format = format_map[format.lower()]
+    output_format = format_map[args.format]
 
     # Map mode string to enum
     mode_map = {
@@ -145,71 +173,77 @@ def main(
         "separate": PageMode.SEPARATE,
         "merge": PageMode.MERGE,
     }
-    page_mode = mode_map[mode.lower()]
+    page_mode = mode_map[args.mode]
 
     # Map version string to enum
-    dwg_version = DWGVersion[version]
+    dwg_version = DWGVersion[args.version]
 
     # Create converter
-    converter = PDFToDWGConverter(oda_path)
+    converter = PDFToDWGConverter(args.oda_path)
 
     # Set up progress reporting
-    if not quiet:
+    if not args.quiet:
+        last_draw = [0.0]
+
         def progress_callback(message: str, progress: float):
-            bar_width = 30
-            filled = int(bar_width * progress)
-            bar = "=" * filled + "-" * (bar_width - filled)
-            click.echo(f"\r[{bar}] {int(progress * 100):3d}% {message}", nl=False)
+            # Redraw at most every PROGRESS_INTERVAL seconds, but always
+            # draw the final state
+            now = time.monotonic()
+            if progress < 1.0 and now - last_draw[0] < PROGRESS_INTERVAL:
+                return
+            last_draw[0] = now
+
+            bar = PROGRESS_BARS[min(max(int(PROGRESS_BAR_WIDTH * progress), 0), PROGRESS_BAR_WIDTH)]
+            print(f"\r[{bar}] {int(progress * 100):3d}% {message}", end="", flush=True)
             if progress >= 1.0:
-                click.echo()  # New line when complete
+                print()  # New line when complete
 
         converter.set_progress_callback(progress_callback)
 
     # Check DWG converter availability
     if output_format in (OutputFormat.DWG, OutputFormat.BOTH):
         if not converter.can_convert_to_dwg():
-            click.echo(click.style("Warning: ODA File Converter not found.", fg="yellow"))
-            click.echo(converter.get_dwg_install_instructions())
+            print(style("Warning: ODA File Converter not found.", fg="yellow"))
+            print(converter.get_dwg_install_instructions())
 
             if output_format == OutputFormat.DWG:
-                click.echo(click.style("Falling back to DXF format...", fg="yellow"))
+                print(style("Falling back to DXF format...", fg="yellow"))
                 output_format = OutputFormat.DXF
                 out_path = os.path.splitext(out_path)[0] + ".dxf"
 
     # Run conversion
-    if not quiet:
-        click.echo(f"Converting: {input_file}")
-        click.echo(f"Output: {out_path}")
+    if not args.quiet:
+        print(f"Converting: {args.input_file}")
+        print(f"Output: {out_path}")
 
     result = converter.convert(
-        input_path=input_file,
+        input_path=args.input_file,
         output_path=out_path,
-        scale=scale,
+        scale=args.scale,
         output_format=output_format,
         dwg_version=dwg_version,
-        dxf_version=dxf_version,
+        dxf_version=args.dxf_version,
         page_mode=page_mode,
-        pages=pages,
-        detect_geometry=not no_geometry_detection,
-        keep_dxf=keep_dxf,
+        pages=args.pages,
+        detect_geometry=not args.no_geometry_detection,
+        keep_dxf=args.keep_dxf,
     )
 
     # Report result
     if result.success:
-        if not quiet:
-            click.echo(click.style("\n✓ Conversion successful!", fg="green"))
-            click.echo(f"  Pages processed: {result.pages_processed}")
-            click.echo(f"  Entities: {result.entities_count}")
-            click.echo("  Output files:")
+        if not args.quiet:
+            print(style("\n✓ Conversion successful!", fg="green"))
+            print(f"  Pages processed: {result.pages_processed}")
+            print(f"  Entities: {result.entities_count}")
+            print("  Output files:")
             for f in result.output_files:
-                click.echo(f"    - {f}")
+                print(f"    - {f}")
         sys.exit(0)
     else:
-        click.echo(click.style(f"\n✗ Conversion failed: {result.message}", fg="red"), err=True)
+        print(style(f"\n✗ Conversion failed: {result.message}", fg="red", stream=sys.stderr), file=sys.stderr)
         sys.exit(1)
 
 
-@click.command()
 def check_oda():
     """Check if ODA File Converter is installed and working."""
     from .dwg_converter import DWGConverter
@@ -217,11 +251,11 @@ def check_oda():
     converter = DWGConverter()
 
     if converter.is_available():
-        click.echo(click.style("✓ ODA File Converter found!", fg="green"))
-        click.echo(f"  Path: {converter.converter_path}")
+        print(style("✓ ODA File Converter found!", fg="green"))
+        print(f"  Path: {converter.converter_path}")
     else:
-        click.echo(click.style("✗ ODA File Converter not found", fg="red"))
-        click.echo(converter._get_install_instructions())
+        print(style("✗ ODA File Converter not found", fg="red"))
+        print(converter._get_install_instructions())
 
 
 if __name__ == "__main__":
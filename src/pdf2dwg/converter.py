@@ -6,13 +6,16 @@ PDF -> Vector Extraction -> DXF -> DWG
 """
 
 import os
+import stat
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional, List, Tuple, Callable
+from typing import Optional, List, Tuple, Callable, Iterator
 from dataclasses import dataclass
 from enum import Enum
 
-from .pdf_extractor import PDFVectorExtractor, ExtractedData, detect_circles_and_arcs, detect_ellipses
+from .pdf_extractor import PDFVectorExtractor, ExtractedData, _detect_geometry, _iter_pages_in_workers
 from .dxf_writer import DXFWriter, create_dxf_from_data, merge_pages_to_dxf
 from .dwg_converter import DWGConverter, DWGVersion, convert_dxf_to_dwg
 
@@ -41,6 +44,36 @@ class ConversionResult:
     entities_count: int = 0
 
 
+# Default number of worker processes used for page extraction
+DEFAULT_NUM_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Upper bound on concurrent page writes (and ODA subprocesses) in SEPARATE mode
+MAX_WRITE_WORKERS = 10
+
+
+def _scratch_root() -> Optional[str]:
+    """
+    Pick a RAM-backed directory for intermediate files, if there is one.
+
+    Returns:
+        XDG_RUNTIME_DIR or /dev/shm when present, otherwise None so the
+        system temp directory is used
+    """
+    for candidate in (os.environ.get("XDG_RUNTIME_DIR"), "/dev/shm"):
+        if candidate and os.path.isdir(candidate) and os.access(candidate, os.W_OK):
+            return candidate
+    return None
+
+
+def _select_pages(pages: List[int], page_count: int) -> List[int]:
+    """
+    Drop out-of-range and repeated page numbers, keeping the requested order.
+
+    Repeats are removed because each page maps to one output file.
+    """
+    return list(dict.fromkeys(p for p in pages if 0 <= p < page_count))
+
+
 class PDFToDWGConverter:
     """
     Main converter class for PDF to DWG conversion.
@@ -107,6 +140,7 @@ class PDFToDWGConverter:
         detect_ellipse: bool = True,
         keep_dxf: bool = False,
         use_true_color: bool = True,
+        num_workers: int = DEFAULT_NUM_WORKERS,
     ) -> ConversionResult:
         """
         Convert PDF to DWG/DXF.
@@ -124,6 +158,12 @@ class PDFToDWGConverter:
             detect_ellipse: Try to detect ellipses from polylines
             keep_dxf: Keep intermediate DXF file when converting to DWG
             use_true_color: Use 24-bit RGB colors (requires DXF R2004+)
+            num_workers: Number of parallel workers for page extraction and
+                         per-page output in SEPARATE mode. 1 disables parallelism.
+                         Extraction workers are processes: on Windows and macOS,
+                         scripts must call convert() under an
+                         `if __name__ == "__main__":` guard, otherwise pages
+                         are extracted in-process.
 
         Returns:
             ConversionResult with status and output files
@@ -131,8 +171,13 @@ class PDFToDWGConverter:
         input_path = os.path.abspath(input_path)
         output_path = os.path.abspath(output_path)
 
-        # Validate input
-        if not os.path.isfile(input_path):
+        # Validate input with a single stat call
+        try:
+            input_is_file = stat.S_ISREG(os.stat(input_path).st_mode)
+        except OSError:
+            input_is_file = False
+
+        if not input_is_file:
             return ConversionResult(
                 success=False,
                 output_files=[],
@@ -150,9 +195,24 @@ class PDFToDWGConverter:
 
         self._report_progress("Opening PDF...", 0.0)
 
+        scratch = None
+
         try:
-            # Extract vector data from PDF
-            with PDFVectorExtractor(input_path) as extractor:
+            # Determine output paths
+            output_dir = os.path.dirname(output_path)
+            output_base = os.path.splitext(os.path.basename(output_path))[0]
+
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+
+            # Built once; per-page names are derived from it
+            base = Path(output_dir or ".") / output_base
+
+            # Extract vector data from PDF. Geometry detection runs on a
+            # separate thread, so the PDF is only held open for extraction.
+            detection_futures = []
+            with ThreadPoolExecutor(max_workers=1) as detector, \
+                    PDFVectorExtractor(input_path) as extractor:
                 page_count = extractor.page_count
 
                 if page_count == 0:
@@ -164,62 +224,76 @@ class PDFToDWGConverter:
 
                 # Determine which pages to process
                 if pages is not None:
-                    pages_to_process = [p for p in pages if 0 <= p < page_count]
+                    pages_to_process = _select_pages(pages, page_count)
                 elif page_mode == PageMode.SINGLE:
                     pages_to_process = [0]
                 else:
                     pages_to_process = list(range(page_count))
 
-                self._report_progress(f"Extracting {len(pages_to_process)} page(s)...", 0.1)
-
-                # Extract all requested pages
-                extracted_pages: List[ExtractedData] = []
-                for i, page_num in enumerate(pages_to_process):
-                    progress = 0.1 + 0.4 * (i / len(pages_to_process))
-                    self._report_progress(f"Extracting page {page_num + 1}...", progress)
-
-                    page_data = extractor.extract_page(page_num, scale)
+                n_pages = len(pages_to_process)
+                self._report_progress(f"Extracting {n_pages} page(s)...", 0.1)
 
-                    # Optionally detect circles and arcs
-                    if detect_geometry:
-                        detect_circles_and_arcs(page_data)
+                # Small jobs are extracted in-process to avoid worker startup overhead
+                use_workers = num_workers > 1 and n_pages > 2
 
-                    # Optionally detect ellipses
-                    if detect_ellipse:
-                        detect_ellipses(page_data)
+                # Extract all requested pages
+                if not use_workers:
+                    step = 0.4 / max(n_pages, 1)
+                    for i, page_num in enumerate(pages_to_process):
+                        progress = 0.1 + step * i
+                        self._report_progress(f"Extracting page {page_num + 1}...", progress)
+
+                        page_data = extractor.extract_page(page_num, scale)
+
+                        # Detect geometry while the next page is extracted
+                        detection_futures.append(detector.submit(
+                            _detect_geometry, page_data, detect_geometry, detect_ellipse
+                        ))
+
+            if use_workers:
+                page_iter = self._iter_pages_parallel(
+                    input_path, pages_to_process, scale,
+                    detect_geometry, detect_ellipse, num_workers
+                )
+            else:
+                page_iter = (future.result() for future in detection_futures)
 
-                    extracted_pages.append(page_data)
+            # Collect pages in order, counting entities as they arrive
+            extracted_pages: List[ExtractedData] = []
+            total_entities = 0
+            for page_data in page_iter:
+                total_entities += page_data.get_entity_count()
+                extracted_pages.append(page_data)
+
+            # When only DWG output is wanted, intermediate DXF files are
+            # written to a scratch directory (tmpfs where available) instead
+            # of the output directory. Not for pages with images, whose files
+            # are saved next to the DXF and referenced from the DWG.
+            dxf_base = base
+            if (output_format == OutputFormat.DWG and not keep_dxf
+                    and not any(page.images for page in extracted_pages)):
+                scratch = tempfile.TemporaryDirectory(dir=_scratch_root())
+                dxf_base = Path(scratch.name) / output_base
 
             # Create output files
             output_files = []
-            total_entities = 0
-
-            # Calculate total entities
-            for data in extracted_pages:
-                total_entities += data.get_entity_count()
 
             self._report_progress("Creating DXF...", 0.5)
 
-            # Determine output paths
-            output_dir = os.path.dirname(output_path)
-            output_base = os.path.splitext(os.path.basename(output_path))[0]
-
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-
             if page_mode == PageMode.MERGE or len(extracted_pages) == 1:
                 # Single output file
-                dxf_path = os.path.join(output_dir or ".", f"{output_base}.dxf")
+                dxf_path = str(dxf_base.with_name(f"{dxf_base.name}.dxf"))
 
                 if len(extracted_pages) == 1:
                     create_dxf_from_data(extracted_pages[0], dxf_path, dxf_version)
                 else:
-                    merge_pages_to_dxf(extracted_pages, dxf_path, dxf_version)
+                    merge_pages_to_dxf(extracted_pages, dxf_path, dxf_version,
+                                       in_place=True)
 
                 # Convert to DWG if needed
                 if output_format in (OutputFormat.DWG, OutputFormat.BOTH):
                     self._report_progress("Converting to DWG...", 0.7)
-                    dwg_path = os.path.join(output_dir or ".", f"{output_base}.dwg")
+                    dwg_path = str(base.with_name(f"{base.name}.dwg"))
                     success, msg = self.dwg_converter.convert(dxf_path, dwg_path, dwg_version)
 
                     if success:
@@ -234,33 +308,57 @@ class PDFToDWGConverter:
 
                 if output_format in (OutputFormat.DXF, OutputFormat.BOTH) or keep_dxf:
                     output_files.append(dxf_path)
-                elif os.path.isfile(dxf_path):
+                elif scratch is None and os.path.isfile(dxf_path):
                     os.remove(dxf_path)  # Clean up intermediate DXF
 
             else:
-                # Separate output files for each page
-                for i, page_data in enumerate(extracted_pages):
-                    page_num = pages_to_process[i]
-                    progress = 0.5 + 0.4 * (i / len(extracted_pages))
-                    self._report_progress(f"Processing page {page_num + 1}...", progress)
-
-                    dxf_path = os.path.join(output_dir or ".", f"{output_base}_page{page_num + 1}.dxf")
-                    create_dxf_from_data(page_data, dxf_path, dxf_version)
-
-                    if output_format in (OutputFormat.DWG, OutputFormat.BOTH):
-                        dwg_path = os.path.join(output_dir or ".", f"{output_base}_page{page_num + 1}.dwg")
-                        success, msg = self.dwg_converter.convert(dxf_path, dwg_path, dwg_version)
-
+                # Separate output files for each page. DXF writing is I/O
+                # heavy, so pages are written concurrently on threads; DWG
+                # conversion then runs once for all pages, since every ODA
+                # File Converter invocation pays a process startup cost.
+                to_dwg = output_format in (OutputFormat.DWG, OutputFormat.BOTH)
+                keep_page_dxf = output_format in (OutputFormat.DXF, OutputFormat.BOTH) or keep_dxf
+                n_pages = len(extracted_pages)
+                dxf_paths = [
+                    str(dxf_base.with_name(f"{dxf_base.name}_page{page_num + 1}.dxf"))
+                    for page_num in pages_to_process
+                ]
+                max_workers = max(1, min(num_workers, n_pages, MAX_WRITE_WORKERS))
+                write_span = 0.2 if to_dwg else 0.4
+
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(create_dxf_from_data, page_data, dxf_paths[i], dxf_version): i
+                        for i, page_data in enumerate(extracted_pages)
+                    }
+
+                    for done, future in enumerate(as_completed(futures)):
+                        i = futures[future]
+                        future.result()
+                        progress = 0.5 + write_span * (done / n_pages)
+                        self._report_progress(f"Processed page {pages_to_process[i] + 1}...", progress)
+
+                dwg_paths: List[Optional[str]] = [None] * n_pages
+                if to_dwg:
+                    self._report_progress("Converting to DWG...", 0.7)
+                    targets = [
+                        str(base.with_name(f"{base.name}_page{page_num + 1}.dwg"))
+                        for page_num in pages_to_process
+                    ]
+                    results = self.dwg_converter.convert_many(dxf_paths, targets, dwg_version)
+                    for i, (success, msg) in enumerate(results):
+                        # Continue with other pages, but note the failure
                         if success:
-                            output_files.append(dwg_path)
-                        else:
-                            # Continue with other pages, but note the failure
-                            pass
+                            dwg_paths[i] = targets[i]
 
-                    if output_format in (OutputFormat.DXF, OutputFormat.BOTH) or keep_dxf:
+                # Collect output files in page order
+                for dxf_path, dwg_path in zip(dxf_paths, dwg_paths):
+                    if dwg_path:
+                        output_files.append(dwg_path)
+                    if keep_page_dxf:
                         output_files.append(dxf_path)
-                    elif os.path.isfile(dxf_path):
-                        os.remove(dxf_path)
+                    elif scratch is None and os.path.isfile(dxf_path):
+                        os.remove(dxf_path)  # Clean up intermediate DXF
 
             self._report_progress("Complete!", 1.0)
 
@@ -279,6 +377,50 @@ class PDFToDWGConverter:
                 message=f"Conversion error: {str(e)}"
             )
 
+        finally:
+            if scratch is not None:
+                scratch.cleanup()
+
+    def _iter_pages_parallel(
+        self,
+        input_path: str,
+        pages_to_process: List[int],
+        scale: float,
+        detect_geometry: bool,
+        detect_ellipse: bool,
+        num_workers: int,
+    ) -> Iterator[ExtractedData]:
+        """
+        Extract pages in parallel worker processes.
+
+        Results are yielded in the same order as pages_to_process. If the
+        worker pool breaks, the remaining pages are extracted in-process.
+        """
+        n = len(pages_to_process)
+        done = 0
+        try:
+            page_iter = _iter_pages_in_workers(
+                input_path, pages_to_process, scale, num_workers,
+                detect_geometry=detect_geometry, detect_ellipse=detect_ellipse,
+            )
+            for page_data in page_iter:
+                progress = 0.1 + 0.4 * (done / n)
+                self._report_progress(f"Extracting page {pages_to_process[done] + 1}...", progress)
+                done += 1
+                yield page_data
+            return
+        except BrokenProcessPool:
+            # Workers died or could not start, e.g. on spawn platforms when
+            # the calling script has no `if __name__ == "__main__":` guard
+            pass
+
+        with PDFVectorExtractor(input_path) as extractor:
+            for page_num in pages_to_process[done:]:
+                progress = 0.1 + 0.4 * (done / n)
+                self._report_progress(f"Extracting page {page_num + 1}...", progress)
+                done += 1
+                yield extractor.extract_and_detect(page_num, scale, detect_geometry, detect_ellipse)
+
     def convert_to_dxf_only(
         self,
         input_path: str,
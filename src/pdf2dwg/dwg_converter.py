@@ -5,16 +5,37 @@ Converts DXF files to DWG format using ODA File Converter.
 The ODA File Converter is a free tool from Open Design Alliance.
 """
 
+import functools
 import os
 import subprocess
 import shutil
 import tempfile
 import platform
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, List, Tuple
 from enum import Enum
 
 
+# Default number of concurrent converter processes in convert_batch
+DEFAULT_BATCH_WORKERS = os.cpu_count() or 1
+
+# Platform the converter is looked up for, resolved once at import
+_SYSTEM = platform.system()
+
+# Extra arguments for starting converter processes: on Windows, don't
+# allocate a console window
+_POPEN_KWARGS = {}
+if os.name == "nt":
+    _POPEN_KWARGS["creationflags"] = subprocess.CREATE_NO_WINDOW
+
+# Batch runs are polled for progress and killed once they stall
+BATCH_POLL_INTERVAL = 5
+BATCH_STALL_SECONDS = 300
+BATCH_STALL_PER_FILE = 10
+
+
 class DWGVersion(Enum):
     """Supported DWG versions for output"""
     ACAD9 = "ACAD9"
@@ -30,6 +51,193 @@ class DWGVersion(Enum):
     ACAD2018 = "ACAD2018"
 
 
+@functools.lru_cache(maxsize=None)
+def _locate_oda(system: str) -> Optional[str]:
+    """
+    Find ODA File Converter for a platform.
+
+    Cached, since probing the default paths and PATH costs several stat
+    calls and converters are created per conversion.
+
+    Args:
+        system: platform.system() value
+
+    Returns:
+        Path to converter executable or None if not found
+    """
+    # Check default paths
+    for path in DWGConverter.DEFAULT_PATHS.get(system, ()):
+        if os.path.isfile(path):
+            return path
+
+    # Try to find in PATH
+    exe_name = "ODAFileConverter"
+    if system == "Windows":
+        exe_name += ".exe"
+
+    found = shutil.which(exe_name)
+    if found:
+        return found
+
+    # Check environment variable
+    env_path = os.environ.get("ODA_FILE_CONVERTER")
+    if env_path and os.path.isfile(env_path):
+        return env_path
+
+    return None
+
+
+def _abspath(path: str) -> str:
+    """os.path.abspath, skipping the getcwd() call for absolute paths"""
+    return path if os.path.isabs(path) else os.path.abspath(path)
+
+
+def _stage_file(src: str, dst: str):
+    """
+    Make src available at dst, avoiding a byte copy where possible.
+
+    Tries a hard link first, then a symbolic link, and only copies as a last
+    resort (different filesystems, or no symlink privilege on Windows).
+
+    Args:
+        src: Existing file
+        dst: New path, which must not exist yet
+    """
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    try:
+        os.symlink(src, dst)
+        return
+    except OSError:
+        pass
+
+    shutil.copy2(src, dst)
+
+
+def _is_only_drawing(directory: str, filename: str) -> bool:
+    """Check whether filename is the only DXF/DWG file directly in directory"""
+    found = False
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith((".dxf", ".dwg")):
+                    continue
+                if entry.name != filename or not entry.is_file():
+                    return False
+                found = True
+    except OSError:
+        return False
+    return found
+
+
+def _list_drawings(directory: str, recursive: bool) -> List[str]:
+    """List DXF/DWG files in directory as paths relative to it"""
+    if recursive:
+        drawings = []
+        for root, _, files in os.walk(directory):
+            for name in files:
+                if name.lower().endswith((".dxf", ".dwg")):
+                    drawings.append(os.path.relpath(os.path.join(root, name), directory))
+        return drawings
+
+    with os.scandir(directory) as entries:
+        return [
+            entry.name for entry in entries
+            if entry.name.lower().endswith((".dxf", ".dwg"))
+            and entry.is_file(follow_symlinks=False)
+        ]
+
+
+def _run_converter(cmd: List[str], timeout: float) -> subprocess.CompletedProcess:
+    """
+    Run one ODA File Converter process.
+
+    Only stderr is kept for error messages; stdout is discarded rather
+    than buffered and decoded, since it is not used on success.
+    """
+    return subprocess.run(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        timeout=timeout,
+        **_POPEN_KWARGS
+    )
+
+
+def _count_files(directory: str) -> int:
+    """Count files below directory"""
+    return sum(len(files) for _, _, files in os.walk(directory))
+
+
+def _run_converter_watched(cmd: List[str], output_dir: str,
+                           n_files: int) -> subprocess.CompletedProcess:
+    """
+    Run one ODA File Converter process for a batch, watching its progress.
+
+    Instead of a fixed timeout, the process is killed once no new file has
+    appeared in output_dir for a stall limit scaled with the batch size.
+
+    Args:
+        cmd: Converter command line
+        output_dir: Directory the converter writes to
+        n_files: Number of files in the batch
+
+    Returns:
+        CompletedProcess with stderr as text
+
+    Raises:
+        subprocess.TimeoutExpired: If the converter stalled
+    """
+    stall_limit = max(BATCH_STALL_SECONDS, BATCH_STALL_PER_FILE * n_files)
+
+    # stderr goes to a file, a pipe could fill up while we are polling
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=stderr,
+                                **_POPEN_KWARGS)
+        last_count = 0
+        last_progress = time.monotonic()
+        while True:
+            try:
+                proc.wait(timeout=BATCH_POLL_INTERVAL)
+                break
+            except subprocess.TimeoutExpired:
+                pass
+
+            count = _count_files(output_dir)
+            now = time.monotonic()
+            if count != last_count:
+                last_count = count
+                last_progress = now
+            elif now - last_progress > stall_limit:
+                proc.kill()
+                proc.wait()
+                raise subprocess.TimeoutExpired(cmd, stall_limit)
+
+        stderr.seek(0)
+        error_output = stderr.read().decode(errors="replace")
+
+    return subprocess.CompletedProcess(cmd, proc.returncode, None, error_output)
+
+
+def _move_file(src: str, dst: str):
+    """
+    Move a generated file into place, replacing any existing file.
+
+    A rename when both paths share a filesystem, otherwise a plain content
+    copy (sendfile-backed on Linux); metadata of generated files is not kept.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
 class DWGConverter:
     """
     Convert DXF files to DWG format using ODA File Converter.
@@ -67,53 +275,50 @@ class DWGConverter:
                           If None, will try to find it automatically.
         """
         self.converter_path = converter_path or self._find_converter()
+        self.refresh()
 
     def _find_converter(self) -> Optional[str]:
         """
         Find ODA File Converter on the system.
 
+        The lookup is cached per platform; see invalidate_cache().
+
         Returns:
             Path to converter executable or None if not found
         """
-        system = platform.system()
-
-        # Check default paths
-        paths = self.DEFAULT_PATHS.get(system, [])
-        for path in paths:
-            if os.path.isfile(path):
-                return path
+        return _locate_oda(_SYSTEM)
 
-        # Try to find in PATH
-        exe_name = "ODAFileConverter"
-        if system == "Windows":
-            exe_name += ".exe"
-
-        found = shutil.which(exe_name)
-        if found:
-            return found
+    @classmethod
+    def invalidate_cache(cls):
+        """Forget the cached converter location, e.g. after installing ODA"""
+        _locate_oda.cache_clear()
 
-        # Check environment variable
-        env_path = os.environ.get("ODA_FILE_CONVERTER")
-        if env_path and os.path.isfile(env_path):
-            return env_path
-
-        return None
+    def refresh(self):
+        """Re-check whether converter_path exists, e.g. after changing it"""
+        self._available = self.converter_path is not None and os.path.isfile(self.converter_path)
 
     def is_available(self) -> bool:
-        """Check if ODA File Converter is available"""
-        return self.converter_path is not None and os.path.isfile(self.converter_path)
+        """Check if ODA File Converter is available (checked once, see refresh())"""
+        return self._available
 
     def convert(self, input_path: str, output_path: str,
                 version: DWGVersion = DWGVersion.ACAD2010,
-                audit: bool = True) -> Tuple[bool, str]:
+                audit: bool = False,
+                retry_with_audit: bool = True) -> Tuple[bool, str]:
         """
         Convert a single DXF file to DWG.
 
+        The audit pass is off by default, since DXF files written by this
+        package do not need repairing and auditing is a large part of the
+        converter's work. If no DWG is produced, the conversion is retried
+        once with audit enabled.
+
         Args:
             input_path: Path to input DXF file
             output_path: Path for output DWG file
             version: Target DWG version
             audit: Whether to run audit on the file
+            retry_with_audit: Retry with audit if the first run fails
 
         Returns:
             Tuple of (success, message)
@@ -121,24 +326,47 @@ class DWGConverter:
         if not self.is_available():
             return False, self._get_install_instructions()
 
-        input_path = os.path.abspath(input_path)
-        output_path = os.path.abspath(output_path)
+        input_path = _abspath(input_path)
+        output_path = _abspath(output_path)
 
         if not os.path.isfile(input_path):
             return False, f"Input file not found: {input_path}"
 
         # ODA File Converter works with directories
-        # Create temp directory structure
-        with tempfile.TemporaryDirectory() as temp_dir:
-            input_dir = os.path.join(temp_dir, "input")
+        # Create temp directory structure next to the output, so the result
+        # can be renamed into place
+        try:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        except OSError as e:
+            return False, f"Conversion error: {str(e)}"
+
+        try:
+            result = self._convert_once(input_path, output_path, version, audit)
+            if not result[0] and retry_with_audit and not audit:
+                result = self._convert_once(input_path, output_path, version, True)
+            return result
+        except subprocess.TimeoutExpired:
+            return False, "Conversion timed out after 5 minutes"
+        except Exception as e:
+            return False, f"Conversion error: {str(e)}"
+
+    def _convert_once(self, input_path: str, output_path: str,
+                      version: DWGVersion, audit: bool) -> Tuple[bool, str]:
+        """Run the converter once for a single file"""
+        input_filename = os.path.basename(input_path)
+        input_dir = os.path.dirname(input_path)
+        input_in_place = _is_only_drawing(input_dir, input_filename)
+
+        with tempfile.TemporaryDirectory(prefix=".pdf2dwg-", dir=os.path.dirname(output_path)) as temp_dir:
             output_dir = os.path.join(temp_dir, "output")
-            os.makedirs(input_dir)
             os.makedirs(output_dir)
 
-            # Copy input file
-            input_filename = os.path.basename(input_path)
-            temp_input = os.path.join(input_dir, input_filename)
-            shutil.copy2(input_path, temp_input)
+            # Stage input file, unless it is the only drawing in its folder
+            # and the converter can read that folder directly
+            if not input_in_place:
+                input_dir = os.path.join(temp_dir, "input")
+                os.makedirs(input_dir)
+                _stage_file(input_path, os.path.join(input_dir, input_filename))
 
             # Build command
             # ODAFileConverter "input_folder" "output_folder" version type recurse audit
@@ -152,46 +380,145 @@ class DWGConverter:
                 "1" if audit else "0"
             ]
 
+            # Run converter
+            result = _run_converter(cmd, 300)  # 5 minute timeout
+
+            # Check for output file
+            output_filename = os.path.splitext(input_filename)[0] + ".dwg"
+            temp_output = os.path.join(output_dir, output_filename)
+
+            if os.path.isfile(temp_output):
+                _move_file(temp_output, output_path)
+                return True, f"Successfully converted to {output_path}"
+            else:
+                error_msg = result.stderr or "Unknown error"
+                return False, f"Conversion failed: {error_msg}"
+
+    def convert_many(self, input_paths: List[str], output_paths: List[str],
+                     version: DWGVersion = DWGVersion.ACAD2010,
+                     audit: bool = False,
+                     retry_with_audit: bool = True) -> List[Tuple[bool, str]]:
+        """
+        Convert several DXF files to DWG with a single converter run.
+
+        ODA File Converter processes whole directories, so all inputs are
+        staged into one temp directory instead of starting it once per file.
+
+        Args:
+            input_paths: Paths to input DXF files
+            output_paths: Paths for output DWG files, parallel to input_paths
+            version: Target DWG version
+            audit: Whether to run audit on the files
+            retry_with_audit: Convert files that failed again, one by one,
+                with audit enabled
+
+        Returns:
+            List of (success, message) tuples, one per input file
+        """
+        if len(input_paths) != len(output_paths):
+            raise ValueError("input_paths and output_paths must have the same length")
+
+        if not self.is_available():
+            instructions = self._get_install_instructions()
+            return [(False, instructions)] * len(input_paths)
+
+        results: List[Optional[Tuple[bool, str]]] = [None] * len(input_paths)
+        failed = []
+
+        # Temp directory next to the (first) output so results can be renamed
+        output_root = os.path.dirname(_abspath(output_paths[0])) if output_paths else None
+        if output_root:
             try:
-                # Run converter
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300  # 5 minute timeout
-                )
+                os.makedirs(output_root, exist_ok=True)
+            except OSError as e:
+                return [(False, f"Conversion error: {str(e)}")] * len(input_paths)
 
-                # Check for output file
-                output_filename = os.path.splitext(input_filename)[0] + ".dwg"
-                temp_output = os.path.join(output_dir, output_filename)
+        with tempfile.TemporaryDirectory(prefix=".pdf2dwg-", dir=output_root) as temp_dir:
+            input_dir = os.path.join(temp_dir, "input")
+            output_dir = os.path.join(temp_dir, "output")
+            os.makedirs(input_dir)
+            os.makedirs(output_dir)
+
+            # Stage input files, keeping staged names unique so every
+            # output can be mapped back to its input
+            staged = {}
+            used_names = set()
+            for i, input_path in enumerate(input_paths):
+                input_path = _abspath(input_path)
+                if not os.path.isfile(input_path):
+                    results[i] = (False, f"Input file not found: {input_path}")
+                    continue
 
-                if os.path.isfile(temp_output):
-                    # Ensure output directory exists
-                    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                    shutil.copy2(temp_output, output_path)
-                    return True, f"Successfully converted to {output_path}"
-                else:
-                    error_msg = result.stderr or result.stdout or "Unknown error"
-                    return False, f"Conversion failed: {error_msg}"
+                input_filename = os.path.basename(input_path)
+                if input_filename.lower() in used_names:
+                    input_filename = f"{i}_{input_filename}"
+                used_names.add(input_filename.lower())
+
+                _stage_file(input_path, os.path.join(input_dir, input_filename))
+                staged[i] = input_filename
+
+            if not staged:
+                return results
+
+            cmd = [
+                self.converter_path,
+                input_dir,
+                output_dir,
+                version.value,
+                "DWG",
+                "0",  # Don't recurse subdirectories
+                "1" if audit else "0"
+            ]
+
+            try:
+                result = _run_converter(cmd, 300 * len(staged))  # 5 minutes per file
+                error_msg = result.stderr or "Unknown error"
+
+                for i, input_filename in staged.items():
+                    output_filename = os.path.splitext(input_filename)[0] + ".dwg"
+                    temp_output = os.path.join(output_dir, output_filename)
+                    output_path = _abspath(output_paths[i])
+
+                    if os.path.isfile(temp_output):
+                        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                        _move_file(temp_output, output_path)
+                        results[i] = (True, f"Successfully converted to {output_path}")
+                    else:
+                        results[i] = (False, f"Conversion failed: {error_msg}")
+                        failed.append(i)
 
             except subprocess.TimeoutExpired:
-                return False, "Conversion timed out after 5 minutes"
+                for i in staged:
+                    results[i] = (False, "Conversion timed out")
             except Exception as e:
-                return False, f"Conversion error: {str(e)}"
+                for i in staged:
+                    results[i] = (False, f"Conversion error: {str(e)}")
+
+        if retry_with_audit and not audit:
+            for i in failed:
+                results[i] = self.convert(input_paths[i], output_paths[i], version,
+                                          audit=True, retry_with_audit=False)
+
+        return results
 
     def convert_batch(self, input_dir: str, output_dir: str,
                       version: DWGVersion = DWGVersion.ACAD2010,
                       recursive: bool = False,
-                      audit: bool = True) -> Tuple[bool, str]:
+                      audit: bool = False,
+                      max_workers: Optional[int] = None) -> Tuple[bool, str]:
         """
         Convert all DXF files in a directory to DWG.
 
+        ODA File Converter handles one file at a time, so with several files
+        the batch is split into shards converted by concurrent processes.
+
         Args:
             input_dir: Directory containing DXF files
             output_dir: Directory for output DWG files
             version: Target DWG version
             recursive: Process subdirectories
             audit: Whether to run audit on files
+            max_workers: Concurrent converter processes (default: CPU count)
 
         Returns:
             Tuple of (success, message)
@@ -199,14 +526,25 @@ class DWGConverter:
         if not self.is_available():
             return False, self._get_install_instructions()
 
-        input_dir = os.path.abspath(input_dir)
-        output_dir = os.path.abspath(output_dir)
+        input_dir = _abspath(input_dir)
+        output_dir = _abspath(output_dir)
 
         if not os.path.isdir(input_dir):
             return False, f"Input directory not found: {input_dir}"
 
         os.makedirs(output_dir, exist_ok=True)
 
+        try:
+            n_files = len(_list_drawings(input_dir, recursive))
+        except OSError:
+            n_files = 0
+        n_shards = min(max_workers or DEFAULT_BATCH_WORKERS, n_files)
+
+        if n_shards > 1:
+            return self._convert_batch_sharded(
+                input_dir, output_dir, version, recursive, audit, n_shards
+            )
+
         cmd = [
             self.converter_path,
             input_dir,
@@ -218,30 +556,114 @@ class DWGConverter:
         ]
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600  # 1 hour timeout for batch
-            )
+            result = _run_converter_watched(cmd, output_dir, n_files)
 
             # Count output files
-            dwg_count = sum(1 for f in os.listdir(output_dir) if f.endswith('.dwg'))
+            with os.scandir(output_dir) as entries:
+                dwg_count = sum(
+                    1 for entry in entries
+                    if entry.name.endswith('.dwg') and entry.is_file(follow_symlinks=False)
+                )
 
             if dwg_count > 0:
                 return True, f"Converted {dwg_count} file(s) to {output_dir}"
             else:
-                error_msg = result.stderr or result.stdout or "No files converted"
+                error_msg = result.stderr or "No files converted"
+                return False, f"Batch conversion failed: {error_msg}"
+
+        except subprocess.TimeoutExpired as e:
+            return False, f"Batch conversion stalled for {e.timeout} seconds"
+        except Exception as e:
+            return False, f"Batch conversion error: {str(e)}"
+
+    def _convert_batch_sharded(self, input_dir: str, output_dir: str,
+                               version: DWGVersion, recursive: bool,
+                               audit: bool, n_shards: int) -> Tuple[bool, str]:
+        """
+        Convert a directory with several converter processes at once.
+
+        Files are staged round-robin into per-shard input directories (keeping
+        their relative paths), each shard is converted by its own process, and
+        the results are moved into output_dir.
+        """
+        try:
+            drawings = _list_drawings(input_dir, recursive)
+            shards = [drawings[i::n_shards] for i in range(n_shards)]
+
+            with tempfile.TemporaryDirectory(prefix=".pdf2dwg-", dir=output_dir) as temp_dir:
+                commands = []
+                shard_outputs = []
+                for i, shard in enumerate(shards):
+                    shard_input = os.path.join(temp_dir, f"worker_{i}", "input")
+                    shard_output = os.path.join(temp_dir, f"worker_{i}", "output")
+                    os.makedirs(shard_output)
+                    for rel_path in shard:
+                        staged = os.path.join(shard_input, rel_path)
+                        os.makedirs(os.path.dirname(staged), exist_ok=True)
+                        _stage_file(os.path.join(input_dir, rel_path), staged)
+
+                    commands.append([
+                        self.converter_path,
+                        shard_input,
+                        shard_output,
+                        version.value,
+                        "DWG",
+                        "1" if recursive else "0",
+                        "1" if audit else "0"
+                    ])
+                    shard_outputs.append(shard_output)
+
+                # The work happens in the converter processes, so threads
+                # are enough to run them concurrently. A stalled shard must
+                # not discard the output of the shards that finished.
+                results = []
+                finished_outputs = []
+                stall_timeouts = []
+                with ThreadPoolExecutor(max_workers=n_shards) as executor:
+                    futures = {
+                        executor.submit(_run_converter_watched, cmd, shard_output, len(shard)): shard_output
+                        for cmd, shard_output, shard in zip(commands, shard_outputs, shards)
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            results.append(future.result())
+                        except subprocess.TimeoutExpired as e:
+                            stall_timeouts.append(e.timeout)
+                            continue
+                        finished_outputs.append(futures[future])
+
+                # Move results into place, keeping relative paths
+                dwg_count = 0
+                for shard_output in finished_outputs:
+                    for root, _, files in os.walk(shard_output):
+                        for name in files:
+                            if not name.lower().endswith(".dwg"):
+                                continue
+                            src = os.path.join(root, name)
+                            dst = os.path.join(output_dir, os.path.relpath(src, shard_output))
+                            os.makedirs(os.path.dirname(dst), exist_ok=True)
+                            _move_file(src, dst)
+                            dwg_count += 1
+
+            if stall_timeouts:
+                return False, (
+                    f"Batch conversion stalled for {max(stall_timeouts)} seconds in "
+                    f"{len(stall_timeouts)} of {n_shards} shard(s); "
+                    f"converted {dwg_count} file(s) to {output_dir}"
+                )
+            elif dwg_count > 0:
+                return True, f"Converted {dwg_count} file(s) to {output_dir}"
+            else:
+                errors = [r.stderr for r in results if r.stderr]
+                error_msg = "\n".join(errors) or "No files converted"
                 return False, f"Batch conversion failed: {error_msg}"
 
-        except subprocess.TimeoutExpired:
-            return False, "Batch conversion timed out after 1 hour"
         except Exception as e:
             return False, f"Batch conversion error: {str(e)}"
 
     def _get_install_instructions(self) -> str:
         """Get installation instructions for ODA File Converter"""
-        system = platform.system()
+        system = _SYSTEM
 
         msg = """
 ODA File Converter is required but not found.
@@ -280,7 +702,8 @@ Alternatively, set the ODA_FILE_CONVERTER environment variable to the path.
 
 def convert_dxf_to_dwg(dxf_path: str, dwg_path: Optional[str] = None,
                        version: str = "ACAD2010",
-                       converter_path: Optional[str] = None) -> Tuple[bool, str]:
+                       converter_path: Optional[str] = None,
+                       audit: bool = False) -> Tuple[bool, str]:
     """
     Convenience function to convert DXF to DWG.
 
@@ -289,6 +712,8 @@ def convert_dxf_to_dwg(dxf_path: str, dwg_path: Optional[str] = None,
         dwg_path: Path for output DWG file (default: same name with .dwg extension)
         version: Target DWG version (ACAD2000, ACAD2004, ACAD2007, ACAD2010, ACAD2013, ACAD2018)
         converter_path: Optional path to ODA File Converter
+        audit: Run the converter's audit pass (it is also run automatically
+            if the first conversion fails)
 
     Returns:
         Tuple of (success, message)
@@ -302,7 +727,15 @@ def convert_dxf_to_dwg(dxf_path: str, dwg_path: Optional[str] = None,
         return False, f"Invalid version: {version}. Valid options: {[v.name for v in DWGVersion]}"
 
     converter = DWGConverter(converter_path)
-    return converter.convert(dxf_path, dwg_path, dwg_version)
+    return converter.convert(dxf_path, dwg_path, dwg_version, audit=audit)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_odafc():
+    """Import ezdxf and its odafc addon once"""
+    import ezdxf
+    from ezdxf.addons import odafc
+    return ezdxf, odafc
 
 
 def try_ezdxf_odafc(dxf_path: str, dwg_path: str,
@@ -321,14 +754,17 @@ def try_ezdxf_odafc(dxf_path: str, dwg_path: str,
         Tuple of (success, message)
     """
     try:
-        import ezdxf
-        from ezdxf.addons import odafc
+        ezdxf, odafc = _get_odafc()
 
-        # Load DXF
-        doc = ezdxf.readfile(dxf_path)
+        if hasattr(odafc, "convert"):
+            # Convert file to file, without loading the DXF into ezdxf
+            odafc.convert(dxf_path, dwg_path, version=version, audit=False)
+        else:
+            # Load DXF
+            doc = ezdxf.readfile(dxf_path)
 
-        # Export as DWG
-        odafc.export_dwg(doc, dwg_path, version=version)
+            # Export as DWG
+            odafc.export_dwg(doc, dwg_path, version=version)
 
         if os.path.isfile(dwg_path):
             return True, f"Successfully converted to {dwg_path}"
@@ -7,12 +7,23 @@ Supports all entity types including hatches, images, and line types.
 """
 
 import ezdxf
-from ezdxf import units
+from ezdxf import DXFValueError, units
+from ezdxf.entities import (
+    Line as DXFLine, Circle as DXFCircle, Arc as DXFArc, LWPolyline as DXFLWPolyline
+)
+from ezdxf.entities.ellipse import MIN_RATIO
+from ezdxf.entities.lwpolyline import LWPolylinePoints
 from ezdxf.enums import TextEntityAlignment
+from ezdxf.math import Vec3
+from ezdxf.tools.pattern import ISO_PATTERN
 from ezdxf.tools.standards import linetypes
 from typing import Optional, Tuple, Dict, List
+import bisect
+import hashlib
+import io
 import math
 import os
+import sys
 import tempfile
 
 from .pdf_extractor import (
@@ -21,6 +32,47 @@ from .pdf_extractor import (
 )
 
 
+# Pages with at least this many lines have their LINE entities serialized
+# directly instead of through ezdxf's generic per-attribute export
+FAST_LINE_THRESHOLD = 10000
+
+# Write buffer for saving DXF files
+SAVE_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+def _supports_fast_entities() -> bool:
+    """Check that ezdxf keeps DXF attribute values in the namespace __dict__"""
+    try:
+        return "handle" in DXFLine().dxf.__dict__
+    except Exception:
+        return False
+
+
+# Create LINE, CIRCLE, ARC and LWPOLYLINE entities without ezdxf's per-attribute
+# validation (see DXFWriter._new_entity)
+FAST_ENTITIES = _supports_fast_entities()
+
+
+def _open_dxf(path: str):
+    """
+    Open a DXF file for writing as Document.saveas(encoding='utf-8') does,
+    but with a large buffer, since ezdxf writes one small string per tag.
+    """
+    return open(path, "wt", encoding="utf-8", errors="dxfreplace",
+                buffering=SAVE_BUFFER_SIZE)
+
+
+def _write_file(path: str, data: bytes):
+    """Write data to path with unbuffered os-level calls"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 class DXFWriter:
     """
     Write extracted vector data to DXF format.
@@ -51,6 +103,21 @@ class DXFWriter:
         (0.5, 0.5, 0.5): 8,    # Gray
     }
 
+    # Standard lineweights in 1/100 mm
+    STANDARD_LINEWEIGHTS = (0, 5, 9, 13, 15, 18, 20, 25, 30, 35, 40, 50,
+                            53, 60, 70, 80, 90, 100, 106, 120, 140, 158,
+                            200, 211)
+
+    # Predefined hatch patterns; other names are written as solid fills
+    HATCH_PATTERNS = frozenset(ISO_PATTERN) - {"SOLID"}
+
+    # Gradient type mapping
+    GRADIENT_TYPES = {
+        "LINEAR": 0,
+        "CYLINDRICAL": 1,
+        "SPHERICAL": 2,
+    }
+
     # DXF version mapping
     VERSION_MAP = {
         "R12": "R12",
@@ -85,8 +152,18 @@ class DXFWriter:
         self.msp = None
         self.layers_created = set()
         self.linetypes_created = set()
+        self.linetypes_present = set()
         self.image_counter = 0
         self.output_dir = ""
+        self._image_defs: Dict[bytes, tuple] = {}
+        self.deferred_lines: List[Line] = []
+        # Drawings use few distinct colors, so conversions are memoised
+        self._aci_cache: Dict[Tuple[float, float, float], int] = {}
+        self._true_color_cache: Dict[Tuple[float, float, float], int] = {}
+        self._style_cache: Dict[tuple, Dict] = {}
+        self._layer_cache: Dict[str, str] = {}
+        self._linetype_cache: Dict[LineType, str] = {}
+        self._lineweight_cache: Dict[int, int] = {}
         # True color requires R2004 or later
         self.use_true_color = use_true_color and self.version not in ("R12", "R2000")
 
@@ -105,6 +182,11 @@ class DXFWriter:
 
         # Create new document with specified version
         self.doc = ezdxf.new(self.version)
+        self._image_defs = {}
+        # Styles, layer and linetype names refer to tables of the document
+        self._style_cache = {}
+        self._layer_cache = {}
+        self._linetype_cache = {}
 
         # Set units to millimeters (common for technical drawings)
         self.doc.units = units.MM
@@ -114,15 +196,22 @@ class DXFWriter:
 
         # Set up line types
         self._setup_linetypes()
+        self.linetypes_present = {linetype.dxf.name for linetype in self.doc.linetypes}
 
         # Get modelspace for adding entities
         self.msp = self.doc.modelspace()
 
         # Create layers based on extracted data
+        self.layers_created = set()
         self._setup_layers(data)
+        self.layers_created.update(layer.dxf.name for layer in self.doc.layers)
 
-        # Add all entities
-        self._add_lines(data.lines)
+        # Add all entities. Large line sets are written directly on save.
+        self.deferred_lines = []
+        if len(data.lines) >= FAST_LINE_THRESHOLD:
+            self.deferred_lines = data.lines
+        else:
+            self._add_lines(data.lines)
         self._add_circles(data.circles)
         self._add_arcs(data.arcs)
         self._add_ellipses(data.ellipses)
@@ -237,21 +326,63 @@ class DXFWriter:
         if not layer_name:
             return "0"
 
+        resolved = self._layer_cache.get(layer_name)
+        if resolved is not None:
+            return resolved
+
+        # Interned, so all entities on a layer share one name object
+        resolved = sys.intern(layer_name)
         if layer_name not in self.layers_created:
             try:
                 self.doc.layers.add(layer_name)
                 self.layers_created.add(layer_name)
             except Exception:
-                layer_name = "0"  # Fallback to default layer
-        return layer_name
+                resolved = "0"  # Fallback to default layer
+        self._layer_cache[layer_name] = resolved
+        return resolved
+
+    def _style_attribs(self, layer: str, linetype: LineType,
+                       color: Tuple[float, float, float],
+                       width: Optional[float] = None) -> Dict:
+        """
+        Get the layer, linetype, lineweight and color attributes of a style.
+
+        Entities mostly share a few styles, so the attributes are built once
+        per style. The returned dict is shared; copy it before adding
+        entity specific attributes.
+
+        Args:
+            layer: Layer name
+            linetype: Line type
+            color: RGB tuple with values 0-1
+            width: Line width in mm, or None to leave the lineweight unset
+
+        Returns:
+            Dictionary of DXF attributes
+        """
+        key = (layer, linetype, color, width)
+        attribs = self._style_cache.get(key)
+        if attribs is None:
+            attribs = {
+                "layer": self._get_or_create_layer(layer),
+                "linetype": self._get_linetype(linetype),
+            }
+            if width is not None:
+                attribs["lineweight"] = self._mm_to_lineweight(width)
+            attribs.update(self._get_color_attribs(color))
+            self._style_cache[key] = attribs
+        return attribs
 
     def _get_linetype(self, linetype: LineType) -> str:
         """Get DXF linetype name from LineType enum"""
-        dxf_linetype = self.LINETYPE_MAP.get(linetype, "Continuous")
+        dxf_linetype = self._linetype_cache.get(linetype)
+        if dxf_linetype is None:
+            dxf_linetype = self.LINETYPE_MAP.get(linetype, "Continuous")
 
-        # Ensure linetype exists in document
-        if dxf_linetype != "Continuous" and not self.doc.linetypes.has_entry(dxf_linetype):
-            return "Continuous"
+            # Ensure linetype exists in document
+            if dxf_linetype != "Continuous" and dxf_linetype not in self.linetypes_present:
+                dxf_linetype = "Continuous"
+            self._linetype_cache[linetype] = dxf_linetype
 
         return dxf_linetype
 
@@ -265,6 +396,13 @@ class DXFWriter:
         Returns:
             ACI color number (1-255)
         """
+        aci = self._aci_cache.get(color)
+        if aci is None:
+            aci = self._aci_cache[color] = self._nearest_aci(color)
+        return aci
+
+    def _nearest_aci(self, color: Tuple[float, float, float]) -> int:
+        """Find the ACI color for an RGB color (uncached)"""
         # Check for exact match in color map
         for rgb, aci in self.COLOR_MAP.items():
             if self._colors_match(color, rgb):
@@ -316,10 +454,13 @@ class DXFWriter:
         Returns:
             24-bit RGB color value for DXF true_color attribute
         """
-        r = int(min(255, max(0, color[0] * 255)))
-        g = int(min(255, max(0, color[1] * 255)))
-        b = int(min(255, max(0, color[2] * 255)))
-        return (r << 16) | (g << 8) | b
+        true_color = self._true_color_cache.get(color)
+        if true_color is None:
+            r = int(min(255, max(0, color[0] * 255)))
+            g = int(min(255, max(0, color[1] * 255)))
+            b = int(min(255, max(0, color[2] * 255)))
+            true_color = self._true_color_cache[color] = (r << 16) | (g << 8) | b
+        return true_color
 
     def _get_color_attribs(self, color: Tuple[float, float, float]) -> Dict:
         """
@@ -347,77 +488,76 @@ class DXFWriter:
                 abs(c1[1] - c2[1]) < tolerance and
                 abs(c1[2] - c2[2]) < tolerance)
 
+    def _new_entity(self, entity_class, dxfattribs: Dict):
+        """
+        Create a graphic entity in modelspace.
+
+        On the fast path the attributes are stored directly, skipping
+        ezdxf's per-attribute lookup, validation and casting, which
+        dominates the cost of msp.add_line() and friends. Callers must pass
+        values of the final types (Vec3 points, floats) and existing
+        layers and linetypes.
+
+        Args:
+            entity_class: ezdxf entity class (DXFLine, DXFCircle, DXFArc,
+                DXFLWPolyline)
+            dxfattribs: DXF attributes including geometry
+
+        Returns:
+            The new entity
+        """
+        if not FAST_ENTITIES:
+            return self.msp.new_entity(entity_class.DXFTYPE, dxfattribs)
+
+        entity = entity_class()
+        entity.doc = self.doc
+        entity.dxf.__dict__.update(dxfattribs)
+        self.doc.entitydb.add(entity)
+        self.msp.add_entity(entity)
+        return entity
+
     def _add_lines(self, lines: List[Line]):
         """Add line entities to modelspace"""
         for line in lines:
-            layer = self._get_or_create_layer(line.layer)
-            linetype = self._get_linetype(line.linetype)
-
-            attribs = {
-                "layer": layer,
-                "linetype": linetype,
-                "lineweight": self._mm_to_lineweight(line.width)
-            }
-            attribs.update(self._get_color_attribs(line.color))
-
-            self.msp.add_line(
-                start=(line.start.x, line.start.y),
-                end=(line.end.x, line.end.y),
-                dxfattribs=attribs
-            )
+            attribs = dict(self._style_attribs(line.layer, line.linetype, line.color, line.width))
+            attribs["start"] = Vec3(line.start.x, line.start.y)
+            attribs["end"] = Vec3(line.end.x, line.end.y)
+            self._new_entity(DXFLine, attribs)
 
     def _add_circles(self, circles: List[Circle]):
         """Add circle entities to modelspace"""
         for circle in circles:
-            layer = self._get_or_create_layer(circle.layer)
-            linetype = self._get_linetype(circle.linetype)
-
-            attribs = {
-                "layer": layer,
-                "linetype": linetype,
-                "lineweight": self._mm_to_lineweight(circle.width)
-            }
-            attribs.update(self._get_color_attribs(circle.color))
-
-            self.msp.add_circle(
-                center=(circle.center.x, circle.center.y),
-                radius=circle.radius,
-                dxfattribs=attribs
-            )
+            attribs = dict(self._style_attribs(circle.layer, circle.linetype,
+                                               circle.color, circle.width))
+            attribs["center"] = Vec3(circle.center.x, circle.center.y)
+            attribs["radius"] = float(circle.radius)
+            self._new_entity(DXFCircle, attribs)
 
     def _add_arcs(self, arcs: List[Arc]):
         """Add arc entities to modelspace"""
         for arc in arcs:
-            layer = self._get_or_create_layer(arc.layer)
-            linetype = self._get_linetype(arc.linetype)
-
-            attribs = {
-                "layer": layer,
-                "linetype": linetype,
-                "lineweight": self._mm_to_lineweight(arc.width)
-            }
-            attribs.update(self._get_color_attribs(arc.color))
-
-            self.msp.add_arc(
-                center=(arc.center.x, arc.center.y),
-                radius=arc.radius,
-                start_angle=arc.start_angle,
-                end_angle=arc.end_angle,
-                dxfattribs=attribs
-            )
+            attribs = dict(self._style_attribs(arc.layer, arc.linetype, arc.color, arc.width))
+            attribs["center"] = Vec3(arc.center.x, arc.center.y)
+            attribs["radius"] = float(arc.radius)
+            attribs["start_angle"] = float(arc.start_angle)
+            attribs["end_angle"] = float(arc.end_angle)
+            self._new_entity(DXFArc, attribs)
 
     def _add_ellipses(self, ellipses: List[Ellipse]):
         """Add ellipse entities to modelspace"""
-        for ellipse in ellipses:
-            layer = self._get_or_create_layer(ellipse.layer)
-            linetype = self._get_linetype(ellipse.linetype)
+        # ELLIPSE requires R2000
+        if self.version == "R12":
+            return
 
-            attribs = {
-                "layer": layer,
-                "linetype": linetype,
-            }
-            attribs.update(self._get_color_attribs(ellipse.color))
+        for ellipse in ellipses:
+            # Skip ellipses ezdxf would reject: axis ratio out of range or
+            # a zero length major axis
+            if not MIN_RATIO <= abs(ellipse.ratio) <= 1.0:
+                continue
+            if ellipse.major_axis.x == 0 and ellipse.major_axis.y == 0:
+                continue
 
+            attribs = self._style_attribs(ellipse.layer, ellipse.linetype, ellipse.color)
             try:
                 self.msp.add_ellipse(
                     center=(ellipse.center.x, ellipse.center.y),
@@ -427,33 +567,36 @@ class DXFWriter:
                     end_param=ellipse.end_param,
                     dxfattribs=attribs
                 )
-            except Exception:
-                # Fallback: convert to polyline approximation
-                pass
+            except DXFValueError:
+                # Degenerate or non-finite axis the checks above let through
+                continue
 
     def _add_polylines(self, polylines: List[Polyline]):
         """Add polyline entities to modelspace"""
+        # LWPOLYLINE requires R2000; add_lwpolyline raises for R12
+        fast = FAST_ENTITIES and self.version != "R12"
         for polyline in polylines:
             if len(polyline.points) < 2:
                 continue
 
-            layer = self._get_or_create_layer(polyline.layer)
-            linetype = self._get_linetype(polyline.linetype)
-
-            attribs = {
-                "layer": layer,
-                "linetype": linetype,
-                "lineweight": self._mm_to_lineweight(polyline.width)
-            }
-            attribs.update(self._get_color_attribs(polyline.color))
+            attribs = self._style_attribs(polyline.layer, polyline.linetype,
+                                          polyline.color, polyline.width)
 
-            points = [(p.x, p.y) for p in polyline.points]
+            if fast:
+                # Fill the vertex array (x, y, start width, end width, bulge)
+                # directly instead of parsing every point by format
+                attribs = dict(attribs)
+                attribs["flags"] = 1 if polyline.closed else 0
+                entity = self._new_entity(DXFLWPolyline, attribs)
+                entity.lwpoints = LWPolylinePoints([(p.x, p.y, 0, 0, 0) for p in polyline.points])
+            else:
+                points = [(p.x, p.y) for p in polyline.points]
 
-            self.msp.add_lwpolyline(
-                points,
-                close=polyline.closed,
-                dxfattribs=attribs
-            )
+                self.msp.add_lwpolyline(
+                    points,
+                    close=polyline.closed,
+                    dxfattribs=attribs
+                )
 
     def _add_splines(self, splines: List[Spline]):
         """Add spline entities to modelspace"""
@@ -461,58 +604,50 @@ class DXFWriter:
             if len(spline.control_points) < 2:
                 continue
 
-            layer = self._get_or_create_layer(spline.layer)
-            linetype = self._get_linetype(spline.linetype)
-
-            attribs = {
-                "layer": layer,
-                "linetype": linetype,
-            }
-            attribs.update(self._get_color_attribs(spline.color))
-
+            attribs = self._style_attribs(spline.layer, spline.linetype, spline.color)
             # Convert control points to fit points for better compatibility
             fit_points = [(p.x, p.y) for p in spline.control_points]
 
+            if self.version == "R12":
+                # SPLINE and LWPOLYLINE require R2000, use an R12 POLYLINE
+                self.msp.add_polyline2d(fit_points, dxfattribs=attribs)
+                continue
+
             try:
-                # Try to add as spline
                 self.msp.add_spline(
                     fit_points,
-                    degree=min(spline.degree, len(fit_points) - 1),
-                    dxfattribs=attribs
-                )
-            except Exception:
-                # Fallback to polyline if spline fails
-                self.msp.add_lwpolyline(
-                    fit_points,
+                    degree=max(1, min(spline.degree, len(fit_points) - 1)),
                     dxfattribs=attribs
                 )
+            except DXFValueError:
+                continue
 
     def _add_rectangles(self, rectangles: List[Rectangle]):
         """Add rectangle entities as closed polylines"""
+        # LWPOLYLINE requires R2000; add_lwpolyline raises for R12
+        fast = FAST_ENTITIES and self.version != "R12"
         for rect in rectangles:
-            layer = self._get_or_create_layer(rect.layer)
-            linetype = self._get_linetype(rect.linetype)
-
-            attribs = {
-                "layer": layer,
-                "linetype": linetype,
-                "lineweight": self._mm_to_lineweight(rect.line_width)
-            }
-            attribs.update(self._get_color_attribs(rect.color))
-
-            # Create rectangle as closed polyline
-            points = [
-                (rect.corner.x, rect.corner.y),
-                (rect.corner.x + rect.width, rect.corner.y),
-                (rect.corner.x + rect.width, rect.corner.y + rect.height),
-                (rect.corner.x, rect.corner.y + rect.height),
-            ]
-
-            self.msp.add_lwpolyline(
-                points,
-                close=True,
-                dxfattribs=attribs
-            )
+            attribs = self._style_attribs(rect.layer, rect.linetype, rect.color, rect.line_width)
+            x0, y0 = rect.corner.x, rect.corner.y
+            x1, y1 = x0 + rect.width, y0 + rect.height
+
+            if fast:
+                # Closed polyline with its vertex array (x, y, start width,
+                # end width, bulge) filled in directly
+                attribs = dict(attribs)
+                attribs["flags"] = 1
+                polyline = self._new_entity(DXFLWPolyline, attribs)
+                polyline.lwpoints = LWPolylinePoints((
+                    (x0, y0, 0, 0, 0), (x1, y0, 0, 0, 0),
+                    (x1, y1, 0, 0, 0), (x0, y1, 0, 0, 0),
+                ))
+            else:
+                # Create rectangle as closed polyline
+                self.msp.add_lwpolyline(
+                    [(x0, y0), (x1, y0), (x1, y1), (x0, y1)],
+                    close=True,
+                    dxfattribs=attribs
+                )
 
     def _add_hatches(self, hatches: List[Hatch]):
         """
@@ -541,13 +676,7 @@ class DXFWriter:
                     color1 = self._rgb_to_true_color(hatch_data.gradient_color1)
                     color2 = self._rgb_to_true_color(hatch_data.gradient_color2)
 
-                    # Gradient type mapping
-                    gradient_type_map = {
-                        "LINEAR": 0,
-                        "CYLINDRICAL": 1,
-                        "SPHERICAL": 2,
-                    }
-                    gtype = gradient_type_map.get(hatch_data.gradient_type.upper(), 0)
+                    gtype = self.GRADIENT_TYPES.get(hatch_data.gradient_type.upper(), 0)
 
                     try:
                         hatch.set_gradient(
@@ -560,26 +689,23 @@ class DXFWriter:
                     except Exception:
                         # Fallback to solid fill with first color
                         hatch.set_solid_fill()
-                elif hatch_data.pattern_name == "SOLID":
+                elif hatch_data.pattern_name not in self.HATCH_PATTERNS:
+                    # SOLID, or fallback to solid fill if pattern not found
                     hatch.set_solid_fill()
                 else:
                     # Pattern fill
-                    try:
-                        hatch.set_pattern_fill(
-                            hatch_data.pattern_name,
-                            scale=hatch_data.scale,
-                            angle=hatch_data.angle
-                        )
-                        # Set background color if provided
-                        if hatch_data.bgcolor:
-                            try:
-                                bg_color = self._rgb_to_true_color(hatch_data.bgcolor)
-                                hatch.dxf.bgcolor = bg_color
-                            except Exception:
-                                pass
-                    except Exception:
-                        # Fallback to solid fill if pattern not found
-                        hatch.set_solid_fill()
+                    hatch.set_pattern_fill(
+                        hatch_data.pattern_name,
+                        scale=hatch_data.scale,
+                        angle=hatch_data.angle
+                    )
+                    # Set background color if provided
+                    if hatch_data.bgcolor:
+                        try:
+                            bg_color = self._rgb_to_true_color(hatch_data.bgcolor)
+                            hatch.dxf.bgcolor = bg_color
+                        except Exception:
+                            pass
 
                 # Add boundary paths
                 for boundary_points in hatch_data.boundary_paths:
@@ -679,31 +805,34 @@ class DXFWriter:
                 continue
 
             try:
-                # Save image to file
-                self.image_counter += 1
-                image_filename = f"image_{self.image_counter}.png"
-
-                if self.output_dir:
-                    image_path = os.path.join(self.output_dir, image_filename)
-                else:
-                    image_path = image_filename
-
-                # Write image data to file
-                with open(image_path, 'wb') as f:
-                    f.write(image.image_data)
-
-                # Calculate image size in pixels (we need this for DXF)
-                # Use a default DPI of 96 if we can't determine actual size
-                pixels_per_mm = 96 / 25.4  # 96 DPI
-
-                # Add image definition
-                image_def = self.doc.add_image_def(
-                    filename=image_path,
-                    size_in_pixel=(
-                        int(image.width * pixels_per_mm),
-                        int(image.height * pixels_per_mm)
+                # Save image to file and add its definition, once per
+                # distinct image
+                digest = hashlib.blake2b(image.image_data, digest_size=16).digest()
+                image_path, image_def = self._image_defs.get(digest, (None, None))
+                if image_def is None:
+                    self.image_counter += 1
+                    image_filename = f"image_{self.image_counter}.png"
+
+                    if self.output_dir:
+                        image_path = os.path.join(self.output_dir, image_filename)
+                    else:
+                        image_path = image_filename
+
+                    _write_file(image_path, image.image_data)
+
+                    # Calculate image size in pixels (we need this for DXF)
+                    # Use a default DPI of 96 if we can't determine actual size
+                    pixels_per_mm = 96 / 25.4  # 96 DPI
+
+                    # Add image definition
+                    image_def = self.doc.add_image_def(
+                        filename=image_path,
+                        size_in_pixel=(
+                            int(image.width * pixels_per_mm),
+                            int(image.height * pixels_per_mm)
+                        )
                     )
-                )
+                    self._image_defs[digest] = (image_path, image_def)
 
                 # Add image to modelspace
                 layer = self._get_or_create_layer(image.layer)
@@ -731,15 +860,16 @@ class DXFWriter:
 
         DXF lineweights are in 1/100 mm units.
         """
-        # Standard lineweights in 1/100 mm
-        standard_weights = [0, 5, 9, 13, 15, 18, 20, 25, 30, 35, 40, 50,
-                          53, 60, 70, 80, 90, 100, 106, 120, 140, 158,
-                          200, 211]
-
         weight_100 = int(width * 100)
-
-        # Find nearest standard weight
-        nearest = min(standard_weights, key=lambda x: abs(x - weight_100))
+        nearest = self._lineweight_cache.get(weight_100)
+        if nearest is None:
+            # Find nearest standard weight, the lower one on ties
+            weights = self.STANDARD_LINEWEIGHTS
+            i = bisect.bisect_left(weights, weight_100)
+            lower = weights[max(i - 1, 0)]
+            upper = weights[min(i, len(weights) - 1)]
+            nearest = lower if weight_100 - lower <= upper - weight_100 else upper
+            self._lineweight_cache[weight_100] = nearest
         return nearest
 
     def save(self, filepath: str):
@@ -750,8 +880,98 @@ class DXFWriter:
             filepath: Output file path
         """
         if self.doc:
+            if self.deferred_lines:
+                self._save_with_deferred_lines(filepath)
+                return
+
             # Use UTF-8 encoding for proper Chinese character support
-            self.doc.saveas(filepath, encoding='utf-8')
+            self.doc.filename = filepath
+            with _open_dxf(filepath) as f:
+                self.doc.write(f)
+
+    def _save_with_deferred_lines(self, filepath: str):
+        """
+        Save the document with deferred lines spliced into the ENTITIES section.
+
+        ezdxf exports every attribute of every entity generically, which
+        dominates save time for line-heavy drawings. The LINE tags are
+        formatted here instead, with handles reserved from the document so
+        $HANDSEED stays valid.
+        """
+        # Resolve styles first, since that may still add layers
+        style_tags = self._line_style_tags(self.deferred_lines)
+
+        handles = self.doc.entitydb.handles
+        first_handle = int(str(handles), 16)
+        handles.reset("%X" % (first_handle + len(self.deferred_lines)))
+
+        stream = io.StringIO()
+        self.doc.write(stream)
+        text = stream.getvalue()
+        stream.close()
+        split = text.index("  0\nENDSEC\n", text.index("  2\nENTITIES\n"))
+
+        self.doc.filename = filepath
+        with _open_dxf(filepath) as f:
+            f.write(text[:split])
+            self._write_line_tags(f, self.deferred_lines, first_handle, style_tags)
+            f.write(text[split:])
+
+    def _line_style_tags(self, lines: List[Line]) -> Dict[tuple, str]:
+        """
+        Render the style tags of each distinct line style once.
+
+        Returns:
+            Mapping of (layer, linetype, width, color) to the LINE tags between
+            the entity header and the coordinates
+        """
+        body = "100\nAcDbLine\n" if self.version != "R12" else ""
+        style_tags = {}
+        for line in lines:
+            key = (line.layer, line.linetype, line.width, line.color)
+            if key in style_tags:
+                continue
+
+            attribs = self._style_attribs(line.layer, line.linetype, line.color, line.width)
+            style_tags[key] = self._entity_style_tags(attribs) + body
+
+        return style_tags
+
+    def _write_line_tags(self, stream, lines: List[Line], first_handle: int,
+                         style_tags: Dict[tuple, str]):
+        """Write LINE entities as DXF tags, matching ezdxf's output"""
+        if self.version == "R12":
+            head = "  0\nLINE\n  5\n%X\n"
+        else:
+            owner = self.msp.block_record_handle
+            head = "  0\nLINE\n  5\n%X\n330\n" + owner + "\n100\nAcDbEntity\n"
+
+        chunk = []
+        for handle, line in enumerate(lines, first_handle):
+            style = style_tags[(line.layer, line.linetype, line.width, line.color)]
+            chunk.append(
+                f"{head % handle}{style}"
+                f" 10\n{line.start.x}\n 20\n{line.start.y}\n 30\n0.0\n"
+                f" 11\n{line.end.x}\n 21\n{line.end.y}\n 31\n0.0\n"
+            )
+            if len(chunk) >= 4096:
+                stream.write("".join(chunk))
+                chunk.clear()
+
+        stream.write("".join(chunk))
+
+    def _entity_style_tags(self, attribs: Dict) -> str:
+        """Render common entity group codes in the order ezdxf exports them"""
+        tags = [f"  8\n{attribs['layer']}\n"]
+        if attribs.get("linetype"):
+            tags.append(f"  6\n{attribs['linetype']}\n")
+        if "color" in attribs:
+            tags.append(f" 62\n{attribs['color']}\n")
+        if self.version != "R12":
+            tags.append(f"370\n{attribs['lineweight']}\n")
+            if "true_color" in attribs:
+                tags.append(f"420\n{attribs['true_color']}\n")
+        return "".join(tags)
 
     def save_to_bytes(self) -> bytes:
         """
@@ -761,7 +981,11 @@ class DXFWriter:
             DXF file content as bytes
         """
         if self.doc:
-            import io
+            # Deferred lines only have a fast path for file output
+            if self.deferred_lines:
+                self._add_lines(self.deferred_lines)
+                self.deferred_lines = []
+
             stream = io.BytesIO()
             self.doc.write(stream)
             return stream.getvalue()
@@ -787,8 +1011,62 @@ def create_dxf_from_data(data: ExtractedData, output_path: str,
     return output_path
 
 
+def _offset_points(points: List[Point], x_offset: float) -> List[Point]:
+    """Return copies of points shifted right by x_offset."""
+    point = Point
+    return [point(p.x + x_offset, p.y) for p in points]
+
+
+# Entity lists of ExtractedData
+_ENTITY_LISTS = ("lines", "circles", "arcs", "ellipses", "polylines", "splines",
+                 "rectangles", "hatches", "texts", "mtexts", "images")
+
+
+def _offset_page_in_place(page_data: ExtractedData, x_offset: float, layer: str):
+    """
+    Shift all entities of a page right by x_offset and move them to layer.
+
+    Positions are replaced with new Point objects rather than mutated, since
+    the extractor may share a Point between entities.
+    """
+    if not x_offset:
+        # First page: only the layer changes
+        for name in _ENTITY_LISTS:
+            for entity in getattr(page_data, name):
+                entity.layer = layer
+        return
+
+    point = Point
+    for entity in page_data.lines:
+        entity.start = point(entity.start.x + x_offset, entity.start.y)
+        entity.end = point(entity.end.x + x_offset, entity.end.y)
+        entity.layer = layer
+    for entities in (page_data.circles, page_data.arcs, page_data.ellipses):
+        for entity in entities:
+            entity.center = point(entity.center.x + x_offset, entity.center.y)
+            entity.layer = layer
+    for entity in page_data.polylines:
+        entity.points = _offset_points(entity.points, x_offset)
+        entity.layer = layer
+    for entity in page_data.splines:
+        entity.control_points = _offset_points(entity.control_points, x_offset)
+        entity.layer = layer
+    for entity in page_data.rectangles:
+        entity.corner = point(entity.corner.x + x_offset, entity.corner.y)
+        entity.layer = layer
+    for entity in page_data.hatches:
+        entity.boundary_paths = [_offset_points(path, x_offset)
+                                 for path in entity.boundary_paths]
+        entity.layer = layer
+    for entities in (page_data.texts, page_data.mtexts, page_data.images):
+        for entity in entities:
+            entity.position = point(entity.position.x + x_offset, entity.position.y)
+            entity.layer = layer
+
+
 def merge_pages_to_dxf(pages_data: List[ExtractedData], output_path: str,
-                       version: str = "R2010", spacing: float = 50.0) -> str:
+                       version: str = "R2010", spacing: float = 50.0,
+                       in_place: bool = False) -> str:
     """
     Merge multiple pages into a single DXF file.
 
@@ -799,6 +1077,8 @@ def merge_pages_to_dxf(pages_data: List[ExtractedData], output_path: str,
         output_path: Output DXF file path
         version: DXF version
         spacing: Spacing between pages in mm
+        in_place: Move the page entities into the merged drawing instead of
+            copying them. The pages must not be used afterwards.
 
     Returns:
         Path to created DXF file
@@ -809,152 +1089,103 @@ def merge_pages_to_dxf(pages_data: List[ExtractedData], output_path: str,
     # Create combined data
     combined = ExtractedData()
     x_offset = 0.0
+    point = Point  # Local binding, looked up for every translated entity
 
     for i, page_data in enumerate(pages_data):
         page_layer = f"Page_{i+1}"
 
-        # Offset all entities by x_offset
-        for line in page_data.lines:
-            new_line = Line(
-                start=Point(line.start.x + x_offset, line.start.y),
-                end=Point(line.end.x + x_offset, line.end.y),
-                color=line.color,
-                width=line.width,
-                layer=page_layer,
-                linetype=line.linetype
-            )
-            combined.lines.append(new_line)
-
-        for circle in page_data.circles:
-            new_circle = Circle(
-                center=Point(circle.center.x + x_offset, circle.center.y),
-                radius=circle.radius,
-                color=circle.color,
-                width=circle.width,
-                layer=page_layer,
-                linetype=circle.linetype
-            )
-            combined.circles.append(new_circle)
-
-        for arc in page_data.arcs:
-            new_arc = Arc(
-                center=Point(arc.center.x + x_offset, arc.center.y),
-                radius=arc.radius,
-                start_angle=arc.start_angle,
-                end_angle=arc.end_angle,
-                color=arc.color,
-                width=arc.width,
-                layer=page_layer,
-                linetype=arc.linetype
-            )
-            combined.arcs.append(new_arc)
-
-        for ellipse in page_data.ellipses:
-            new_ellipse = Ellipse(
-                center=Point(ellipse.center.x + x_offset, ellipse.center.y),
-                major_axis=ellipse.major_axis,
-                ratio=ellipse.ratio,
-                start_param=ellipse.start_param,
-                end_param=ellipse.end_param,
-                color=ellipse.color,
-                width=ellipse.width,
-                layer=page_layer,
-                linetype=ellipse.linetype
-            )
-            combined.ellipses.append(new_ellipse)
-
-        for polyline in page_data.polylines:
-            new_points = [Point(p.x + x_offset, p.y) for p in polyline.points]
-            new_polyline = Polyline(
-                points=new_points,
-                closed=polyline.closed,
-                color=polyline.color,
-                width=polyline.width,
-                layer=page_layer,
-                linetype=polyline.linetype
-            )
-            combined.polylines.append(new_polyline)
-
-        for spline in page_data.splines:
-            new_points = [Point(p.x + x_offset, p.y) for p in spline.control_points]
-            new_spline = Spline(
-                control_points=new_points,
-                degree=spline.degree,
-                color=spline.color,
-                width=spline.width,
-                layer=page_layer,
-                linetype=spline.linetype
-            )
-            combined.splines.append(new_spline)
-
-        for rect in page_data.rectangles:
-            new_rect = Rectangle(
-                corner=Point(rect.corner.x + x_offset, rect.corner.y),
-                width=rect.width,
-                height=rect.height,
-                color=rect.color,
-                line_width=rect.line_width,
-                layer=page_layer,
-                linetype=rect.linetype,
-                fill_color=rect.fill_color
-            )
-            combined.rectangles.append(new_rect)
-
-        for hatch in page_data.hatches:
-            new_paths = []
-            for path in hatch.boundary_paths:
-                new_path = [Point(p.x + x_offset, p.y) for p in path]
-                new_paths.append(new_path)
-            new_hatch = Hatch(
-                boundary_paths=new_paths,
-                pattern_name=hatch.pattern_name,
-                color=hatch.color,
-                layer=page_layer,
-                scale=hatch.scale,
-                angle=hatch.angle
-            )
-            combined.hatches.append(new_hatch)
-
-        for text in page_data.texts:
-            new_text = TextEntity(
-                text=text.text,
-                position=Point(text.position.x + x_offset, text.position.y),
-                height=text.height,
-                rotation=text.rotation,
-                color=text.color,
-                font=text.font,
-                layer=page_layer,
-                halign=text.halign,
-                valign=text.valign,
-                width_factor=text.width_factor,
-                oblique=text.oblique
-            )
-            combined.texts.append(new_text)
-
-        for mtext in page_data.mtexts:
-            new_mtext = MText(
-                text=mtext.text,
-                position=Point(mtext.position.x + x_offset, mtext.position.y),
-                width=mtext.width,
-                height=mtext.height,
-                rotation=mtext.rotation,
-                color=mtext.color,
-                font=mtext.font,
-                layer=page_layer,
-                attachment_point=mtext.attachment_point
-            )
-            combined.mtexts.append(new_mtext)
-
-        for image in page_data.images:
-            new_image = ImageEntity(
-                position=Point(image.position.x + x_offset, image.position.y),
-                width=image.width,
-                height=image.height,
-                image_data=image.image_data,
-                layer=page_layer,
-                rotation=image.rotation
-            )
-            combined.images.append(new_image)
+        if in_place:
+            _offset_page_in_place(page_data, x_offset, page_layer)
+            for name in _ENTITY_LISTS:
+                getattr(combined, name).extend(getattr(page_data, name))
+            x_offset += page_data.width + spacing
+            continue
+
+        # Offset all entities by x_offset. Geometry-heavy entities are built
+        # with positional arguments, which is notably faster than keywords
+        # for the dataclass constructors.
+        combined.lines.extend([
+            Line(point(line.start.x + x_offset, line.start.y),
+                 point(line.end.x + x_offset, line.end.y),
+                 line.color, line.width, page_layer, line.linetype)
+            for line in page_data.lines
+        ])
+
+        combined.circles.extend([
+            Circle(point(circle.center.x + x_offset, circle.center.y), circle.radius,
+                   circle.color, circle.width, page_layer, circle.linetype)
+            for circle in page_data.circles
+        ])
+
+        combined.arcs.extend([
+            Arc(point(arc.center.x + x_offset, arc.center.y), arc.radius,
+                arc.start_angle, arc.end_angle,
+                arc.color, arc.width, page_layer, arc.linetype)
+            for arc in page_data.arcs
+        ])
+
+        combined.ellipses.extend([
+            Ellipse(point(ellipse.center.x + x_offset, ellipse.center.y),
+                    ellipse.major_axis, ellipse.ratio,
+                    ellipse.start_param, ellipse.end_param,
+                    ellipse.color, ellipse.width, page_layer, ellipse.linetype)
+            for ellipse in page_data.ellipses
+        ])
+
+        combined.polylines.extend([
+            Polyline(_offset_points(polyline.points, x_offset), polyline.closed,
+                     polyline.color, polyline.width, page_layer, polyline.linetype,
+                     list(polyline.bulges), polyline.classified)
+            for polyline in page_data.polylines
+        ])
+
+        combined.splines.extend([
+            Spline(_offset_points(spline.control_points, x_offset), spline.degree,
+                   spline.color, spline.width, page_layer, spline.linetype,
+                   list(spline.knots), list(spline.weights))
+            for spline in page_data.splines
+        ])
+
+        combined.rectangles.extend([
+            Rectangle(point(rect.corner.x + x_offset, rect.corner.y),
+                      rect.width, rect.height, rect.color, rect.line_width,
+                      page_layer, rect.linetype, rect.fill_color)
+            for rect in page_data.rectangles
+        ])
+
+        combined.hatches.extend([
+            Hatch([_offset_points(path, x_offset) for path in hatch.boundary_paths],
+                  hatch.pattern_name, hatch.color, page_layer,
+                  hatch.scale, hatch.angle, hatch.is_gradient, hatch.gradient_type,
+                  hatch.gradient_color1, hatch.gradient_color2,
+                  hatch.gradient_angle, hatch.gradient_centered, hatch.bgcolor)
+            for hatch in page_data.hatches
+        ])
+
+        combined.texts.extend([
+            TextEntity(text.text, point(text.position.x + x_offset, text.position.y),
+                       text.height, text.rotation, text.color, text.font,
+                       page_layer, text.halign, text.valign,
+                       text.width_factor, text.oblique)
+            for text in page_data.texts
+        ])
+
+        combined.mtexts.extend([
+            MText(mtext.text, point(mtext.position.x + x_offset, mtext.position.y),
+                  mtext.width, mtext.height, mtext.rotation, mtext.color,
+                  mtext.font, page_layer, mtext.attachment_point)
+            for mtext in page_data.mtexts
+        ])
+
+        combined.images.extend([
+            ImageEntity(point(image.position.x + x_offset, image.position.y),
+                        image.width, image.height, image.image_data,
+                        page_layer, image.rotation, image.image_path,
+                        image.original_width, image.original_height,
+                        image.colorspace, image.bits_per_component,
+                        image.transparency)
+            for image in page_data.images
+        ])
 
         # Update offset for next page
         x_offset += page_data.width + spacing
@@ -13,12 +13,46 @@ Key optimizations:
 """
 
 import fitz  # PyMuPDF
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Dict, Any, Union
+from typing import List, Tuple, Optional, Dict, Any, Union, Iterator
 from enum import Enum
+import functools
+import glob
+import hashlib
 import math
 import io
+import os
+import pickle
 import struct
+import sys
+
+
+# Maximum deviation of flattened bezier curves from the true curve (PDF points)
+BEZIER_FLATNESS = 0.05
+
+# Limit on bezier subdivision depth (at most 2**depth segments per curve)
+_MAX_SUBDIVISION_DEPTH = 10
+
+# Points whose spread across their principal direction is below this fraction
+# of the spread along it (as a variance ratio, ~1/1000 in length) count as a
+# straight line and are never fitted as a circle or ellipse
+_COLLINEAR_TOLERANCE = 1e-6
+
+# Deepest concavity (fraction of its extent) a polyline may have and still be
+# considered for circle/ellipse fitting
+_CONIC_MAX_CONCAVITY = 0.25
+
+# Largest semi-major axis, as a multiple of the points' extent, accepted from
+# an ellipse fit (2.0 still admits arcs spanning about 30 degrees)
+_MAX_ELLIPSE_OVERHANG = 2.0
+
+# Suggested location for the on-disk page cache (see PDFVectorExtractor)
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".pdf2dwg_cache")
+
+# zlib level for PNGs re-encoded after applying a soft mask (PIL default is 6)
+PNG_COMPRESS_LEVEL = 1
 
 
 class PathType(Enum):
@@ -46,6 +80,8 @@ class LineType(Enum):
 @dataclass
 class Point:
     """2D point with x, y coordinates"""
+    __slots__ = ("x", "y")
+
     x: float
     y: float
 
@@ -128,6 +164,7 @@ class Polyline:
     layer: str = "0"
     linetype: LineType = LineType.CONTINUOUS
     bulges: List[float] = field(default_factory=list)  # For arc segments
+    classified: bool = False  # Already resolved by a geometry detector
 
 
 @dataclass
@@ -263,26 +300,41 @@ class PDFVectorExtractor:
     - Embedded images
     """
 
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, cache_dir: Optional[str] = None):
         """
         Initialize extractor with PDF file path.
 
         Args:
             pdf_path: Path to the PDF file
+            cache_dir: Directory for caching extracted pages on disk, keyed by
+                the PDF's content hash, page number and scale (e.g.
+                DEFAULT_CACHE_DIR). Cached pages are pickles, so only point
+                this at a directory you trust. None disables the cache.
         """
         self.pdf_path = pdf_path
+        self.cache_dir = cache_dir
+        self._fingerprint: Optional[str] = None  # Content hash for cache keys
         self.doc = None
         self.scale = 1.0  # Scale factor for coordinates
+        self._doc_layers: Optional[Dict[str, Any]] = None  # Document-level layer info
+        self._dash_cache: Dict[str, LineType] = {}  # Line type per dash pattern
+        self._color_cache: Dict[int, Tuple[float, float, float]] = {}  # RGB per text color int
+        # Decoded image bytes and metadata per (xref, smask)
+        self._image_cache: Dict[Tuple[int, int], Optional[Tuple[bytes, Dict[str, Any]]]] = {}
 
     def open(self):
         """Open the PDF document"""
         self.doc = fitz.open(self.pdf_path)
+        self._doc_layers = None
+        self._fingerprint = None
 
     def close(self):
         """Close the PDF document"""
         if self.doc:
             self.doc.close()
             self.doc = None
+        self._doc_layers = None
+        self._image_cache.clear()
 
     def __enter__(self):
         self.open()
@@ -313,6 +365,13 @@ class PDFVectorExtractor:
             self.open()
 
         self.scale = scale
+
+        cache_path = self._cache_path(page_num, scale) if self.cache_dir else None
+        if cache_path:
+            data = self._load_cached_page(cache_path)
+            if data is not None:
+                return data
+
         page = self.doc[page_num]
 
         # Get page dimensions
@@ -334,8 +393,92 @@ class PDFVectorExtractor:
         # Extract layers if available
         self._extract_layers(page, data)
 
+        if cache_path:
+            self._store_cached_page(cache_path, data)
+
         return data
 
+    def _cache_path(self, page_num: int, scale: float) -> str:
+        """Path of the page cache file for a page of this PDF at a scale"""
+        if self._fingerprint is None:
+            from . import __version__
+
+            digest = hashlib.blake2b(digest_size=16)
+            with open(self.pdf_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            # Extraction output changes between releases
+            digest.update(__version__.encode())
+            self._fingerprint = digest.hexdigest()
+
+        return os.path.join(self.cache_dir, f"{self._fingerprint}_{page_num}_{scale!r}.pkl")
+
+    @staticmethod
+    def _load_cached_page(cache_path: str) -> Optional[ExtractedData]:
+        """Load a cached page, or None if it is missing or unreadable"""
+        try:
+            with open(cache_path, "rb") as f:
+                data = pickle.load(f)
+        except Exception:
+            return None
+        return data if isinstance(data, ExtractedData) else None
+
+    @staticmethod
+    def _store_cached_page(cache_path: str, data: ExtractedData):
+        """Write a page to the cache; failures only cost the cache entry"""
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    @classmethod
+    def clear_cache(cls, cache_dir: str = DEFAULT_CACHE_DIR) -> int:
+        """
+        Delete all cached pages in a cache directory.
+
+        Args:
+            cache_dir: Page cache directory
+
+        Returns:
+            Number of cache files removed
+        """
+        removed = 0
+        for path in glob.glob(os.path.join(glob.escape(cache_dir), "*.pkl")):
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def extract_and_detect(self, page_num: int = 0, scale: float = 1.0,
+                           detect_geometry: bool = True,
+                           detect_ellipse: bool = True) -> ExtractedData:
+        """
+        Extract a page and detect circles, arcs and ellipses in one call.
+
+        Goes through extract_page, so the page cache applies; detection is
+        never cached since it depends on the options.
+
+        Args:
+            page_num: Page number (0-indexed)
+            scale: Scale factor for coordinates (default 1.0)
+            detect_geometry: Detect circles and arcs from polylines
+            detect_ellipse: Detect ellipses from polylines
+
+        Returns:
+            ExtractedData containing all extracted elements
+        """
+        data = self.extract_page(page_num, scale)
+        return _detect_geometry(data, detect_geometry, detect_ellipse)
+
     def _transform_y(self, y: float, page_height: float) -> float:
         """
         Transform PDF Y coordinate to CAD Y coordinate.
@@ -351,12 +494,23 @@ class PDFVectorExtractor:
         """
         Parse PDF dash pattern to determine line type.
 
+        Pages typically reuse a handful of dash patterns across all their
+        paths, so the result is cached per pattern.
+
         Args:
             dashes: Dash pattern from PDF (tuple of (pattern, phase) or None)
 
         Returns:
             LineType enum value
         """
+        key = dashes if isinstance(dashes, str) else repr(dashes)
+        linetype = self._dash_cache.get(key)
+        if linetype is None:
+            linetype = self._dash_cache[key] = self._classify_dash_pattern(dashes)
+        return linetype
+
+    def _classify_dash_pattern(self, dashes: Any) -> LineType:
+        """Determine the line type of an uncached dash pattern"""
         if dashes is None:
             return LineType.CONTINUOUS
 
@@ -389,8 +543,19 @@ class PDFVectorExtractor:
         """Extract vector drawings from page"""
         page_height = page.rect.height
 
-        # Get all drawings on the page
-        paths = page.get_drawings()
+        # Get all drawings on the page. The raw form has plain (x, y) tuples
+        # where get_drawings() would wrap every coordinate in a fitz object.
+        paths = page.get_cdrawings()
+
+        scale = self.scale
+        point = Point
+
+        def to_cad(p) -> Point:
+            # Same as _transform_point, without the method lookups per point
+            return point(p[0] * scale, (page_height - p[1]) * scale)
+
+        # One tuple per distinct color, shared by all entities of the page
+        colors: Dict[Tuple[float, float, float], Tuple[float, float, float]] = {}
 
         for path in paths:
             items = path.get("items", [])
@@ -398,19 +563,20 @@ class PDFVectorExtractor:
             if color is None:
                 color = (0, 0, 0)
             fill = path.get("fill")
-            width = (path.get("width") or 1.0) * self.scale
+            width = (path.get("width") or 1.0) * scale
             dashes = path.get("dashes")
             even_odd = path.get("even_odd", True)
             closePath = path.get("closePath", False)
 
-            # Parse line type from dash pattern
-            linetype = self._parse_dash_pattern(dashes)
+            # Parse line type from dash pattern (fill-only paths have none)
+            linetype = self._parse_dash_pattern(dashes) if dashes else LineType.CONTINUOUS
 
             # Convert color from 0-1 to tuple
             if isinstance(color, (list, tuple)) and len(color) >= 3:
                 color = (color[0], color[1], color[2])
             else:
                 color = (0, 0, 0)
+            color = colors.setdefault(color, color)
 
             # Convert fill color
             fill_color = None
@@ -420,6 +586,8 @@ class PDFVectorExtractor:
                 elif isinstance(fill, (int, float)):
                     # Grayscale
                     fill_color = (fill, fill, fill)
+                if fill_color is not None:
+                    fill_color = colors.setdefault(fill_color, fill_color)
 
             # Process path items - collect all subpaths
             all_subpaths = []
@@ -435,13 +603,13 @@ class PDFVectorExtractor:
                     # If we have accumulated points, save them as a subpath
                     if len(path_points) > 1:
                         all_subpaths.append({
-                            'points': path_points.copy(),
+                            'points': path_points,
                             'closed': False,
                             'has_curves': has_curves
                         })
                     path_points = []
                     has_curves = False
-                    current_point = self._transform_point(item[1].x, item[1].y, page_height)
+                    current_point = to_cad(item[1])
                     path_start = current_point
                     path_points.append(current_point)
 
@@ -450,8 +618,8 @@ class PDFVectorExtractor:
                     # If we don't have a current point, use the start point from the line
                     if len(item) >= 3:
                         # Format: ('l', start_point, end_point)
-                        start_point = self._transform_point(item[1].x, item[1].y, page_height)
-                        end_point = self._transform_point(item[2].x, item[2].y, page_height)
+                        start_point = to_cad(item[1])
+                        end_point = to_cad(item[2])
 
                         if current_point is None or len(path_points) == 0:
                             # Start a new path segment
@@ -461,7 +629,7 @@ class PDFVectorExtractor:
                             # Discontinuous line - save previous segment and start new
                             if len(path_points) > 1:
                                 all_subpaths.append({
-                                    'points': path_points.copy(),
+                                    'points': path_points,
                                     'closed': False,
                                     'has_curves': has_curves
                                 })
@@ -469,11 +637,14 @@ class PDFVectorExtractor:
                             path_start = start_point
                             has_curves = False
 
-                        path_points.append(end_point)
+                        # Drop zero-length segments within a path, but keep a
+                        # lone one, which draws a dot
+                        if len(path_points) < 2 or end_point != path_points[-1]:
+                            path_points.append(end_point)
                         current_point = end_point
                     elif len(item) >= 2:
                         # Fallback: single endpoint format
-                        end_point = self._transform_point(item[1].x, item[1].y, page_height)
+                        end_point = to_cad(item[1])
                         if current_point is not None:
                             path_points.append(end_point)
                         current_point = end_point
@@ -481,14 +652,14 @@ class PDFVectorExtractor:
                 elif cmd == "c":  # Cubic bezier curve
                     # item contains: cmd, control1, control2, end_point
                     if len(item) >= 4:
-                        ctrl1 = self._transform_point(item[1].x, item[1].y, page_height)
-                        ctrl2 = self._transform_point(item[2].x, item[2].y, page_height)
-                        end = self._transform_point(item[3].x, item[3].y, page_height)
+                        ctrl1 = to_cad(item[1])
+                        ctrl2 = to_cad(item[2])
+                        end = to_cad(item[3])
 
                         # Convert bezier to line segments for compatibility
                         if current_point:
                             bezier_points = self._bezier_to_points(
-                                current_point, ctrl1, ctrl2, end, segments=16
+                                current_point, ctrl1, ctrl2, end
                             )
                             path_points.extend(bezier_points[1:])  # Skip first (duplicate)
                         has_curves = True
@@ -496,11 +667,11 @@ class PDFVectorExtractor:
 
                 elif cmd == "v":  # Cubic bezier (control point 1 = current point)
                     if len(item) >= 3 and current_point:
-                        ctrl2 = self._transform_point(item[1].x, item[1].y, page_height)
-                        end = self._transform_point(item[2].x, item[2].y, page_height)
+                        ctrl2 = to_cad(item[1])
+                        end = to_cad(item[2])
 
                         bezier_points = self._bezier_to_points(
-                            current_point, current_point, ctrl2, end, segments=16
+                            current_point, current_point, ctrl2, end
                         )
                         path_points.extend(bezier_points[1:])
                         has_curves = True
@@ -508,21 +679,25 @@ class PDFVectorExtractor:
 
                 elif cmd == "y":  # Cubic bezier (control point 2 = end point)
                     if len(item) >= 3 and current_point:
-                        ctrl1 = self._transform_point(item[1].x, item[1].y, page_height)
-                        end = self._transform_point(item[2].x, item[2].y, page_height)
+                        ctrl1 = to_cad(item[1])
+                        end = to_cad(item[2])
 
                         bezier_points = self._bezier_to_points(
-                            current_point, ctrl1, end, end, segments=16
+                            current_point, ctrl1, end, end
                         )
                         path_points.extend(bezier_points[1:])
                         has_curves = True
                         current_point = end
 
                 elif cmd == "re":  # Rectangle
-                    rect = item[1]
-                    corner = self._transform_point(rect.x0, rect.y1, page_height)
-                    rect_width = (rect.x1 - rect.x0) * self.scale
-                    rect_height = (rect.y1 - rect.y0) * self.scale
+                    x0, y0, x1, y1 = item[1]
+                    if x0 > x1:
+                        x0, x1 = x1, x0
+                    if y0 > y1:
+                        y0, y1 = y1, y0
+                    corner = point(x0 * scale, (page_height - y1) * scale)
+                    rect_width = (x1 - x0) * scale
+                    rect_height = (y1 - y0) * scale
 
                     data.rectangles.append(Rectangle(
                         corner=corner,
@@ -554,7 +729,7 @@ class PDFVectorExtractor:
                         path_points.append(path_start)
                     if len(path_points) > 1:
                         all_subpaths.append({
-                            'points': path_points.copy(),
+                            'points': path_points,
                             'closed': True,
                             'has_curves': has_curves
                         })
@@ -563,12 +738,10 @@ class PDFVectorExtractor:
 
                 elif cmd == "qu":  # Quadratic bezier (quad)
                     if len(item) >= 3 and current_point:
-                        ctrl = self._transform_point(item[1].x, item[1].y, page_height)
-                        end = self._transform_point(item[2].x, item[2].y, page_height)
+                        ctrl = to_cad(item[1])
+                        end = to_cad(item[2])
 
-                        quad_points = self._quad_bezier_to_points(
-                            current_point, ctrl, end, segments=12
-                        )
+                        quad_points = self._quad_bezier_to_points(current_point, ctrl, end)
                         path_points.extend(quad_points[1:])
                         has_curves = True
                         current_point = end
@@ -577,7 +750,7 @@ class PDFVectorExtractor:
             if len(path_points) > 1:
                 is_closed = closePath or (path_start and path_points[-1] == path_start)
                 all_subpaths.append({
-                    'points': path_points.copy(),
+                    'points': path_points,
                     'closed': is_closed,
                     'has_curves': has_curves
                 })
@@ -639,7 +812,7 @@ class PDFVectorExtractor:
         else:
             # Polyline
             data.polylines.append(Polyline(
-                points=points.copy(),
+                points=points,
                 closed=closed,
                 color=color,
                 width=width,
@@ -662,106 +835,127 @@ class PDFVectorExtractor:
         # Get first 4 points (ignore closing point if present)
         pts = points[:4]
 
-        # Get unique x and y values with tolerance
+        # The corners must fall into two x values and two y values, two
+        # corners each: sorted, the outer pairs are close, the middle apart
         tolerance = 0.5
-        x_vals = []
-        y_vals = []
-
-        for p in pts:
-            found_x = False
-            found_y = False
-            for x in x_vals:
-                if abs(p.x - x) < tolerance:
-                    found_x = True
-                    break
-            if not found_x:
-                x_vals.append(p.x)
-
-            for y in y_vals:
-                if abs(p.y - y) < tolerance:
-                    found_y = True
-                    break
-            if not found_y:
-                y_vals.append(p.y)
-
-        # Rectangle should have exactly 2 unique x and 2 unique y values
-        return len(x_vals) == 2 and len(y_vals) == 2
+        xs = sorted([pts[0].x, pts[1].x, pts[2].x, pts[3].x])
+        ys = sorted([pts[0].y, pts[1].y, pts[2].y, pts[3].y])
+        return (xs[1] - xs[0] < tolerance and xs[3] - xs[2] < tolerance
+                and xs[2] - xs[1] >= tolerance
+                and ys[1] - ys[0] < tolerance and ys[3] - ys[2] < tolerance
+                and ys[2] - ys[1] >= tolerance)
 
     def _bezier_to_points(self, p0: Point, p1: Point, p2: Point, p3: Point,
-                          segments: int = 16, adaptive: bool = True) -> List[Point]:
+                          segments: int = 16, adaptive: bool = True,
+                          tolerance: Optional[float] = None) -> List[Point]:
         """
-        Convert cubic bezier curve to line segments with adaptive sampling.
+        Convert cubic bezier curve to line segments.
+
+        With adaptive sampling the curve is split by de Casteljau subdivision
+        until each piece is flat, i.e. its control points lie within tolerance
+        of the chord. Flat curves get few points, tight curves get many.
 
         Args:
             p0, p1, p2, p3: Control points of the cubic bezier
-            segments: Base number of segments (minimum)
-            adaptive: If True, increase segments for complex curves
+            segments: Number of segments for uniform sampling; only used when
+                      adaptive is False
+            adaptive: If True, subdivide by flatness instead of uniformly
+            tolerance: Max deviation from the curve in output units
+                       (default BEZIER_FLATNESS scaled to output units)
 
         Returns:
             List of points approximating the bezier curve
         """
-        # Calculate curve complexity for adaptive sampling
-        if adaptive:
-            # Estimate curve length and curvature
-            chord_length = p0.distance_to(p3)
-            control_length = p0.distance_to(p1) + p1.distance_to(p2) + p2.distance_to(p3)
-
-            # Ratio indicates how curved the bezier is
-            if chord_length > 0.001:
-                ratio = control_length / chord_length
-                # Increase segments for more curved paths
-                if ratio > 1.5:
-                    segments = min(64, int(segments * ratio))
-                elif ratio > 1.2:
-                    segments = min(48, int(segments * 1.5))
-                elif ratio > 1.1:
-                    segments = min(32, int(segments * 1.2))
-
-            # Also consider absolute size for large curves
-            if control_length > 100:
-                segments = max(segments, 32)
-            elif control_length > 50:
-                segments = max(segments, 24)
+        if not adaptive:
+            points = _sample_bezier((p0, p1, p2, p3), segments)
+            if points is not None:
+                return points
+
+            points = []
+            for i in range(segments + 1):
+                t = i / segments
+                t2 = t * t
+                t3 = t2 * t
+                mt = 1 - t
+                mt2 = mt * mt
+                mt3 = mt2 * mt
+
+                x = mt3 * p0.x + 3 * mt2 * t * p1.x + 3 * mt * t2 * p2.x + t3 * p3.x
+                y = mt3 * p0.y + 3 * mt2 * t * p1.y + 3 * mt * t2 * p2.y + t3 * p3.y
+
+                points.append(Point(x, y))
+            return points
+
+        if tolerance is None:
+            tolerance = BEZIER_FLATNESS * self.scale
+        tol_sq = tolerance * tolerance
+
+        points = [Point(p0.x, p0.y)]
+
+        # Iterative subdivision on an explicit stack of plain float tuples;
+        # the second half is pushed first so pieces come out in curve order.
+        stack = [(p0.x, p0.y, p1.x, p1.y, p2.x, p2.y, p3.x, p3.y, 0)]
+        while stack:
+            x0, y0, x1, y1, x2, y2, x3, y3, depth = stack.pop()
+
+            # Flatness: distance of inner control points from the chord
+            dx = x3 - x0
+            dy = y3 - y0
+            chord_sq = dx * dx + dy * dy
+            if chord_sq > 1e-18:
+                d1 = (x1 - x0) * dy - (y1 - y0) * dx
+                d2 = (x2 - x0) * dy - (y2 - y0) * dx
+                flat = max(d1 * d1, d2 * d2) <= tol_sq * chord_sq
+            else:
+                flat = max((x1 - x0) ** 2 + (y1 - y0) ** 2,
+                           (x2 - x0) ** 2 + (y2 - y0) ** 2) <= tol_sq
 
-        points = []
-        for i in range(segments + 1):
-            t = i / segments
-            t2 = t * t
-            t3 = t2 * t
-            mt = 1 - t
-            mt2 = mt * mt
-            mt3 = mt2 * mt
+            if flat or depth >= _MAX_SUBDIVISION_DEPTH:
+                points.append(Point(x3, y3))
+                continue
 
-            x = mt3 * p0.x + 3 * mt2 * t * p1.x + 3 * mt * t2 * p2.x + t3 * p3.x
-            y = mt3 * p0.y + 3 * mt2 * t * p1.y + 3 * mt * t2 * p2.y + t3 * p3.y
+            # de Casteljau split at t = 0.5
+            ax, ay = (x0 + x1) * 0.5, (y0 + y1) * 0.5
+            bx, by = (x1 + x2) * 0.5, (y1 + y2) * 0.5
+            cx, cy = (x2 + x3) * 0.5, (y2 + y3) * 0.5
+            abx, aby = (ax + bx) * 0.5, (ay + by) * 0.5
+            bcx, bcy = (bx + cx) * 0.5, (by + cy) * 0.5
+            mx, my = (abx + bcx) * 0.5, (aby + bcy) * 0.5
+
+            depth += 1
+            stack.append((mx, my, bcx, bcy, cx, cy, x3, y3, depth))
+            stack.append((x0, y0, ax, ay, abx, aby, mx, my, depth))
 
-            points.append(Point(x, y))
         return points
 
     def _quad_bezier_to_points(self, p0: Point, p1: Point, p2: Point,
-                                segments: int = 12, adaptive: bool = True) -> List[Point]:
+                                segments: int = 12, adaptive: bool = True,
+                                tolerance: Optional[float] = None) -> List[Point]:
         """
-        Convert quadratic bezier curve to line segments with adaptive sampling.
+        Convert quadratic bezier curve to line segments.
+
+        With adaptive sampling the curve is raised to the equivalent cubic and
+        flattened by subdivision like cubic curves.
 
         Args:
             p0, p1, p2: Control points of the quadratic bezier
-            segments: Base number of segments (minimum)
-            adaptive: If True, increase segments for complex curves
+            segments: Number of segments for uniform sampling; only used when
+                      adaptive is False
+            adaptive: If True, subdivide by flatness instead of uniformly
+            tolerance: Max deviation from the curve in output units
+                       (default BEZIER_FLATNESS scaled to output units)
 
         Returns:
             List of points approximating the bezier curve
         """
         if adaptive:
-            # Estimate curve complexity
-            chord_length = p0.distance_to(p2)
-            control_length = p0.distance_to(p1) + p1.distance_to(p2)
+            c1 = Point(p0.x + (p1.x - p0.x) * (2.0 / 3.0), p0.y + (p1.y - p0.y) * (2.0 / 3.0))
+            c2 = Point(p2.x + (p1.x - p2.x) * (2.0 / 3.0), p2.y + (p1.y - p2.y) * (2.0 / 3.0))
+            return self._bezier_to_points(p0, c1, c2, p2, tolerance=tolerance)
 
-            if chord_length > 0.001:
-                ratio = control_length / chord_length
-                if ratio > 1.3:
-                    segments = min(32, int(segments * ratio))
-                elif ratio > 1.1:
-                    segments = min(24, int(segments * 1.3))
+        points = _sample_bezier((p0, p1, p2), segments)
+        if points is not None:
+            return points
 
         points = []
         for i in range(segments + 1):
@@ -788,6 +982,7 @@ class PDFVectorExtractor:
         - CJK (Chinese/Japanese/Korean) characters
         """
         page_height = page.rect.height
+        colors = self._color_cache
 
         # Get text as dictionary with detailed information
         text_dict = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_PRESERVE_LIGATURES)
@@ -801,8 +996,10 @@ class PDFVectorExtractor:
                     line_dir = line.get("dir", (1, 0))  # Text direction vector
                     line_wmode = line.get("wmode", 0)  # Writing mode (0=horizontal, 1=vertical)
 
-                    # Calculate rotation from direction vector
+                    # Calculate rotation from direction vector, in 0-360 range
                     rotation = math.degrees(math.atan2(line_dir[1], line_dir[0]))
+                    if rotation < 0:
+                        rotation += 360
 
                     for span in line_spans:
                         text = span.get("text", "")
@@ -818,21 +1015,14 @@ class PDFVectorExtractor:
 
                         # Get text properties
                         font_size = span.get("size", 12) * self.scale
-                        font_name = span.get("font", "Arial")
+                        font_name = sys.intern(span.get("font", "Arial"))
                         color = span.get("color", 0)
                         flags = span.get("flags", 0)
                         ascender = span.get("ascender", 1.0)
                         descender = span.get("descender", 0.0)
 
-                        # Parse font flags
-                        is_superscript = bool(flags & 1)
-                        is_italic = bool(flags & 2)
-                        is_serifed = bool(flags & 4)
-                        is_monospaced = bool(flags & 8)
-                        is_bold = bool(flags & 16)
-
-                        # Calculate oblique angle for italic text
-                        oblique = 12.0 if is_italic else 0.0
+                        # Oblique angle for italic text (font flag bit 1)
+                        oblique = 12.0 if flags & 2 else 0.0
 
                         # Calculate width factor from character spacing
                         # Estimate based on bbox and text length
@@ -848,27 +1038,26 @@ class PDFVectorExtractor:
 
                         # Convert color integer to RGB
                         if isinstance(color, int):
-                            r = ((color >> 16) & 0xFF) / 255.0
-                            g = ((color >> 8) & 0xFF) / 255.0
-                            b = (color & 0xFF) / 255.0
-                            color = (r, g, b)
+                            rgb = colors.get(color)
+                            if rgb is None:
+                                rgb = colors[color] = (((color >> 16) & 0xFF) / 255.0,
+                                                       ((color >> 8) & 0xFF) / 255.0,
+                                                       (color & 0xFF) / 255.0)
+                            color = rgb
                         elif isinstance(color, (list, tuple)) and len(color) >= 3:
                             color = (color[0], color[1], color[2])
                         else:
                             color = (0, 0, 0)
 
-                        # Normalize rotation to 0-360 range
-                        if rotation < 0:
-                            rotation += 360
-
                         # Determine horizontal alignment based on position relative to bbox
                         bbox_center_x = (bbox[0] + bbox[2]) / 2
                         origin_x = origin[0]
-                        if abs(origin_x - bbox[0]) < font_size * 0.1:
+                        align_tolerance = font_size * 0.1
+                        if abs(origin_x - bbox[0]) < align_tolerance:
                             halign = "LEFT"
-                        elif abs(origin_x - bbox_center_x) < font_size * 0.1:
+                        elif abs(origin_x - bbox_center_x) < align_tolerance:
                             halign = "CENTER"
-                        elif abs(origin_x - bbox[2]) < font_size * 0.1:
+                        elif abs(origin_x - bbox[2]) < align_tolerance:
                             halign = "RIGHT"
                         else:
                             halign = "LEFT"
@@ -901,6 +1090,7 @@ class PDFVectorExtractor:
         - Image masks and soft masks
         """
         page_height = page.rect.height
+        scale = self.scale
 
         # Get list of images on the page
         image_list = page.get_images(full=True)
@@ -915,51 +1105,24 @@ class PDFVectorExtractor:
                 if not img_rects:
                     continue
 
-                for img_rect in img_rects:
-                    # Extract image data
-                    base_image = self.doc.extract_image(xref)
-                    if not base_image:
-                        continue
-
-                    image_bytes = base_image.get("image")
-                    if not image_bytes:
-                        continue
-
-                    # Get image metadata
-                    img_width = base_image.get("width", 0)
-                    img_height = base_image.get("height", 0)
-                    colorspace = base_image.get("colorspace", "")
-                    bpc = base_image.get("bpc", 8)  # bits per component
-                    img_ext = base_image.get("ext", "png")
-
-                    # Check for transparency (soft mask)
-                    has_transparency = smask > 0
-
-                    # Handle soft mask (transparency) if present
-                    if has_transparency and smask > 0:
-                        try:
-                            mask_image = self.doc.extract_image(smask)
-                            if mask_image and mask_image.get("image"):
-                                # Combine image with alpha mask
-                                image_bytes = self._apply_alpha_mask(
-                                    image_bytes, mask_image.get("image"),
-                                    img_width, img_height, img_ext
-                                )
-                        except Exception:
-                            pass  # Continue without transparency
+                loaded = self._load_image(xref, smask)
+                if loaded is None:
+                    continue
 
-                    # Convert CMYK to RGB if needed
-                    if colorspace and "cmyk" in colorspace.lower():
-                        try:
-                            image_bytes = self._convert_cmyk_to_rgb(image_bytes, img_ext)
-                        except Exception:
-                            pass  # Continue with original
+                image_bytes, base_image = loaded
+                img_width = base_image.get("width", 0)
+                img_height = base_image.get("height", 0)
+                colorspace = base_image.get("colorspace", "")
+                bpc = base_image.get("bpc", 8)  # bits per component
+                has_transparency = smask > 0
 
-                    # Convert image position
-                    x0 = img_rect.x0 * self.scale
-                    y0 = self._transform_y(img_rect.y1, page_height)
-                    rect_width = (img_rect.x1 - img_rect.x0) * self.scale
-                    rect_height = (img_rect.y1 - img_rect.y0) * self.scale
+                for img_rect in img_rects:
+                    # Convert image position (same transform as _transform_y)
+                    rx0, ry0, rx1, ry1 = img_rect
+                    x0 = rx0 * scale
+                    y0 = (page_height - ry1) * scale
+                    rect_width = (rx1 - rx0) * scale
+                    rect_height = (ry1 - ry0) * scale
 
                     # Store image entity
                     data.images.append(ImageEntity(
@@ -981,6 +1144,56 @@ class PDFVectorExtractor:
         # Also extract inline images (images embedded directly in content stream)
         self._extract_inline_images(page, data)
 
+    def _load_image(self, xref: int, smask: int) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """
+        Decode an image XObject, applying its soft mask and CMYK conversion.
+
+        Results are cached per (xref, smask), so an image placed several
+        times or shared between pages is only decoded once.
+
+        Returns:
+            Tuple of (image bytes, extract_image metadata) or None
+        """
+        key = (xref, smask)
+        if key in self._image_cache:
+            return self._image_cache[key]
+
+        result = None
+        base_image = self.doc.extract_image(xref)
+        image_bytes = base_image.get("image") if base_image else None
+        if image_bytes:
+            img_width = base_image.get("width", 0)
+            img_height = base_image.get("height", 0)
+            colorspace = base_image.get("colorspace", "")
+            img_ext = base_image.get("ext", "png")
+
+            # Handle soft mask (transparency) if present
+            if smask > 0:
+                try:
+                    mask_image = self.doc.extract_image(smask)
+                    if mask_image and mask_image.get("image"):
+                        # Combine image with alpha mask
+                        image_bytes = self._apply_alpha_mask(
+                            image_bytes, mask_image.get("image"),
+                            img_width, img_height, img_ext
+                        )
+                except Exception:
+                    pass  # Continue without transparency
+
+            # Convert CMYK to RGB if needed
+            if colorspace and "cmyk" in colorspace.lower():
+                try:
+                    image_bytes = self._convert_cmyk_to_rgb(image_bytes, img_ext)
+                except Exception:
+                    pass  # Continue with original
+
+            # Keep only the metadata; the raw stream is not needed again
+            info = {k: v for k, v in base_image.items() if k != "image"}
+            result = (image_bytes, info)
+
+        self._image_cache[key] = result
+        return result
+
     def _extract_inline_images(self, page: fitz.Page, data: ExtractedData):
         """Extract inline images from page content stream"""
         page_height = page.rect.height
@@ -1013,14 +1226,15 @@ class PDFVectorExtractor:
 
             # Resize mask if needed
             if mask.size != img.size:
-                mask = mask.resize(img.size, Image.Resampling.LANCZOS)
+                mask = mask.resize(img.size, Image.Resampling.BILINEAR)
 
             # Apply mask as alpha channel
             img.putalpha(mask)
 
-            # Save to PNG (supports transparency)
+            # Save to PNG (supports transparency); the writer stores it as an
+            # external file, so favour encode speed over size
             output = io.BytesIO()
-            img.save(output, format='PNG')
+            img.save(output, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
             return output.getvalue()
 
         except ImportError:
@@ -1039,7 +1253,7 @@ class PDFVectorExtractor:
             if img.mode == 'CMYK':
                 img = img.convert('RGB')
                 output = io.BytesIO()
-                img.save(output, format='PNG')
+                img.save(output, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
                 return output.getvalue()
             return image_data
 
@@ -1052,12 +1266,24 @@ class PDFVectorExtractor:
         """
         Extract layer information if available (Optional Content Groups).
 
+        Layers are defined per document, so they are parsed once on first use
+        and shared by all pages extracted from the same document.
+        """
+        if self._doc_layers is None:
+            self._doc_layers = self._read_document_layers()
+        data.layers.update(self._doc_layers)
+
+    def _read_document_layers(self) -> Dict[str, Any]:
+        """
+        Read layer information from the document.
+
         Extracts:
         - Layer name
         - Layer visibility state
         - Layer intent (view/design/all)
         - Layer locking state
         """
+        layers: Dict[str, Any] = {}
         try:
             # Get optional content configuration from document
             oc_config = self.doc.get_oc_items()
@@ -1087,7 +1313,7 @@ class PDFVectorExtractor:
                                     elif "All" in str(layer_obj):
                                         intent = "All"
 
-                            data.layers[f"Layer_{xref}"] = {
+                            layers[f"Layer_{xref}"] = {
                                 "name": layer_name,
                                 "visible": visible,
                                 "locked": locked,
@@ -1096,7 +1322,7 @@ class PDFVectorExtractor:
                             }
                         except Exception:
                             # Fallback to basic layer info
-                            data.layers[f"Layer_{xref}"] = {
+                            layers[f"Layer_{xref}"] = {
                                 "name": layer_name,
                                 "visible": True
                             }
@@ -1107,8 +1333,8 @@ class PDFVectorExtractor:
                 if oc:
                     for i, layer in enumerate(oc):
                         layer_id = f"Layer_{i}"
-                        if layer_id not in data.layers:
-                            data.layers[layer_id] = {
+                        if layer_id not in layers:
+                            layers[layer_id] = {
                                 "name": layer.get("name", layer_id),
                                 "visible": layer.get("on", True)
                             }
@@ -1119,12 +1345,48 @@ class PDFVectorExtractor:
             # PDF might not have layers
             pass
 
-    def extract_all_pages(self, scale: float = 1.0) -> List[ExtractedData]:
+        return layers
+
+    def extract_pages(self, page_nums: List[int], scale: float = 1.0,
+                      workers: Optional[int] = None) -> List[ExtractedData]:
+        """
+        Extract several pages, in parallel worker processes when worthwhile.
+
+        PyMuPDF documents cannot be shared across processes, so each worker
+        opens its own copy of the PDF. One or two pages are extracted in this
+        process, where starting workers would cost more than it saves.
+
+        Args:
+            page_nums: Page numbers (0-indexed)
+            scale: Scale factor for coordinates
+            workers: Maximum number of worker processes (default: CPU count)
+
+        Returns:
+            List of ExtractedData in the order of page_nums
+        """
+        page_nums = list(page_nums)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(page_nums))
+
+        if workers <= 1 or len(page_nums) <= 2:
+            if not self.doc:
+                self.open()
+            return [self.extract_page(i, scale) for i in page_nums]
+
+        self.scale = scale
+        return list(_iter_pages_in_workers(self.pdf_path, page_nums, scale,
+                                           workers, self.cache_dir))
+
+    def extract_all_pages(self, scale: float = 1.0,
+                          workers: Optional[int] = 1) -> List[ExtractedData]:
         """
         Extract vector graphics from all pages.
 
         Args:
             scale: Scale factor for coordinates
+            workers: Maximum number of worker processes (default: 1, in this
+                process; None uses the CPU count, see extract_pages)
 
         Returns:
             List of ExtractedData, one per page
@@ -1132,11 +1394,151 @@ class PDFVectorExtractor:
         if not self.doc:
             self.open()
 
-        results = []
-        for i in range(len(self.doc)):
-            results.append(self.extract_page(i, scale))
+        return self.extract_pages(range(len(self.doc)), scale, workers)
+
+
+# PDF document opened once per page extraction worker process
+_worker_extractor: Optional[PDFVectorExtractor] = None
+
+
+def _init_page_worker(pdf_path: str, cache_dir: Optional[str] = None):
+    """Open the PDF once when a page extraction worker process starts."""
+    global _worker_extractor
+    _worker_extractor = PDFVectorExtractor(pdf_path, cache_dir)
+    _worker_extractor.open()
+
+
+def _extract_page_in_worker(page_num: int, scale: float, detect_geometry: bool,
+                            detect_ellipse: bool) -> Tuple[ExtractedData, Optional[Tuple[bytes, List[int]]]]:
+    """Extract and post-process a single page in a worker process."""
+    data = _worker_extractor.extract_and_detect(page_num, scale, detect_geometry, detect_ellipse)
+    return data, _pack_polyline_points(data)
+
+
+def _iter_pages_in_workers(pdf_path: str, page_nums: List[int], scale: float,
+                           workers: int, cache_dir: Optional[str] = None,
+                           detect_geometry: bool = False,
+                           detect_ellipse: bool = False) -> Iterator[ExtractedData]:
+    """
+    Extract pages in a pool of worker processes.
+
+    PyMuPDF documents cannot be shared across processes, so each worker opens
+    the PDF once and reuses it for every page it handles.
+
+    Args:
+        pdf_path: Path to the PDF file
+        page_nums: Page numbers to extract (0-indexed)
+        scale: Scale factor for coordinates
+        workers: Maximum number of worker processes
+        cache_dir: Page cache directory for the workers, or None
+        detect_geometry: Detect circles and arcs from polylines
+        detect_ellipse: Detect ellipses from polylines
+
+    Returns:
+        Iterator of ExtractedData in the order of page_nums
+    """
+    n = len(page_nums)
+    with ProcessPoolExecutor(
+        max_workers=min(workers, n),
+        initializer=_init_page_worker,
+        initargs=(pdf_path, cache_dir),
+    ) as executor:
+        results = executor.map(
+            _extract_page_in_worker,
+            page_nums,
+            [scale] * n,
+            [detect_geometry] * n,
+            [detect_ellipse] * n,
+        )
+        for data, packed in results:
+            yield _restore_polyline_points(data, packed)
+
+
+def _pack_polyline_points(page_data: ExtractedData) -> Optional[Tuple[bytes, List[int]]]:
+    """
+    Strip the polyline vertices of a page into one flat float64 buffer.
+
+    Pickling thousands of Point objects dominates the cost of returning a page
+    from a worker, so the coordinates travel as raw bytes alongside the
+    polylines, which are sent back without points.
+
+    Returns:
+        Tuple of (coordinate bytes, vertex count per polyline), or None if the
+        page has no polyline vertices
+    """
+    counts = [len(polyline.points) for polyline in page_data.polylines]
+    if not any(counts):
+        return None
+
+    coords = array("d")
+    for polyline in page_data.polylines:
+        for p in polyline.points:
+            coords.append(p.x)
+            coords.append(p.y)
+        polyline.points = []
+
+    return coords.tobytes(), counts
+
+
+def _restore_polyline_points(page_data: ExtractedData,
+                             packed: Optional[Tuple[bytes, List[int]]]) -> ExtractedData:
+    """Rebuild polyline points stripped by _pack_polyline_points"""
+    if packed is None:
+        return page_data
+
+    data, counts = packed
+    coords = array("d")
+    coords.frombytes(data)
+
+    pos = 0
+    for polyline, count in zip(page_data.polylines, counts):
+        end = pos + 2 * count
+        polyline.points = [Point(coords[k], coords[k + 1]) for k in range(pos, end, 2)]
+        pos = end
+
+    return page_data
+
+
+@functools.lru_cache(maxsize=None)
+def _bernstein_basis(degree: int, segments: int):
+    """
+    Bernstein basis of a bezier curve sampled at segments + 1 uniform steps.
+
+    Returns:
+        Read-only array of shape (segments + 1, degree + 1), or None if NumPy
+        is not available
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    t = np.linspace(0.0, 1.0, segments + 1)
+    mt = 1.0 - t
+    basis = np.stack([math.comb(degree, k) * mt ** (degree - k) * t ** k
+                      for k in range(degree + 1)], axis=1)
+    basis.setflags(write=False)
+    return basis
+
+
+def _sample_bezier(control_points: Tuple[Point, ...], segments: int) -> Optional[List[Point]]:
+    """
+    Sample a bezier curve at segments + 1 uniform parameter steps.
+
+    Args:
+        control_points: Control points, degree + 1 of them
+        segments: Number of segments
 
-        return results
+    Returns:
+        List of points on the curve, or None if NumPy is not available
+    """
+    basis = _bernstein_basis(len(control_points) - 1, segments)
+    if basis is None:
+        return None
+
+    import numpy as np
+    xy = basis @ np.array([(p.x, p.y) for p in control_points])
+    return [Point(x, y) for x, y in xy.tolist()]
 
 
 def detect_circles_and_arcs(data: ExtractedData, tolerance: float = 0.02):
@@ -1150,102 +1552,318 @@ def detect_circles_and_arcs(data: ExtractedData, tolerance: float = 0.02):
         data: ExtractedData to process
         tolerance: Tolerance for circle detection (relative to radius)
     """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return  # Circle fitting needs NumPy
+
     new_polylines = []
 
-    for polyline in data.polylines:
-        # Need at least 6 points to reliably detect a circle
-        if len(polyline.points) < 6:
+    # Fit every polyline in one batched pass; only the classification below
+    # runs per polyline
+    batch_fits = _fit_circles_batched(data.polylines)
+
+    for i, polyline in enumerate(data.polylines):
+        fit = batch_fits[i] if batch_fits is not None else None
+        if not _convert_circle(data, polyline, fit, tolerance):
             new_polylines.append(polyline)
-            continue
 
-        # Try to fit a circle to the points
-        result = _fit_circle(polyline.points)
-        if result:
-            center, radius, error = result
-
-            # Check if it's a good fit (error relative to radius)
-            if radius > 0.5 and error < tolerance * radius:
-                # Determine if it's a full circle or arc
-                is_full_circle = _is_full_circle(polyline.points, center, radius)
-
-                if is_full_circle and polyline.closed:
-                    # Full circle
-                    data.circles.append(Circle(
-                        center=Point(center[0], center[1]),
-                        radius=radius,
-                        color=polyline.color,
-                        width=polyline.width,
-                        layer=polyline.layer,
-                        linetype=polyline.linetype
-                    ))
-                else:
-                    # Arc
-                    start_angle, end_angle = _calculate_arc_angles(
-                        center, polyline.points[0], polyline.points[-1]
-                    )
-                    # Ensure proper arc direction
-                    if not _is_ccw(polyline.points, center):
-                        start_angle, end_angle = end_angle, start_angle
-
-                    data.arcs.append(Arc(
-                        center=Point(center[0], center[1]),
-                        radius=radius,
-                        start_angle=start_angle,
-                        end_angle=end_angle,
-                        color=polyline.color,
-                        width=polyline.width,
-                        layer=polyline.layer,
-                        linetype=polyline.linetype
-                    ))
-                continue
+    data.polylines = new_polylines
+
+
+def detect_conics(data: ExtractedData, circle_tolerance: float = 0.02,
+                  ellipse_tolerance: float = 0.05):
+    """
+    Post-process polylines to detect circles, arcs and ellipses in one pass.
 
+    Gives the same result as detect_circles_and_arcs followed by
+    detect_ellipses, but walks and rebuilds the polyline list only once:
+    polylines that are not circles or arcs fall straight through to the
+    ellipse fit.
+
+    Args:
+        data: ExtractedData to process
+        circle_tolerance: Tolerance for circle detection (relative to radius)
+        ellipse_tolerance: Tolerance for ellipse detection (relative to axes)
+    """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return  # Circle/Ellipse fitting needs NumPy
+
+    new_polylines = []
+    batch_fits = _fit_circles_batched(data.polylines)
+
+    for i, polyline in enumerate(data.polylines):
+        fit = batch_fits[i] if batch_fits is not None else None
+        if _convert_circle(data, polyline, fit, circle_tolerance):
+            continue
+        if _convert_ellipse(data, polyline, ellipse_tolerance):
+            continue
         new_polylines.append(polyline)
 
     data.polylines = new_polylines
 
 
-def _is_full_circle(points: List[Point], center: Tuple[float, float], radius: float) -> bool:
-    """Check if points cover a full circle (360 degrees)"""
-    if len(points) < 8:
+def _detect_geometry(data: ExtractedData, detect_geometry: bool,
+                     detect_ellipse: bool) -> ExtractedData:
+    """Run the optional circle/arc and ellipse detection on a page"""
+    # Circles/arcs and ellipses together in a single pass when both are on
+    if detect_geometry and detect_ellipse:
+        detect_conics(data)
+    elif detect_geometry:
+        detect_circles_and_arcs(data)
+    elif detect_ellipse:
+        detect_ellipses(data)
+
+    return data
+
+
+def _convert_circle(data: ExtractedData, polyline: Polyline,
+                    fit: Optional[Tuple[Tuple[float, float], float, float]],
+                    tolerance: float) -> bool:
+    """
+    Append polyline to data as a circle or arc if it fits one.
+
+    Args:
+        data: ExtractedData receiving the circle or arc
+        polyline: Candidate polyline
+        fit: Precomputed (center, radius, error), or None to fit here
+        tolerance: Tolerance for circle detection (relative to radius)
+
+    Returns:
+        True if the polyline was converted
+    """
+    # Need at least 6 points to reliably detect a circle
+    if len(polyline.points) < 6:
         return False
 
-    # Calculate angles of all points
-    angles = []
-    for p in points:
-        angle = math.atan2(p.y - center[1], p.x - center[0])
-        angles.append(angle)
+    # Try to fit a circle to the points
+    result = fit if fit is not None else _fit_circle(polyline.points)
+    if not result:
+        return False
+
+    center, radius, error = result
+
+    # Points lie on a circle too small to convert; keep the polyline
+    # but spare detect_ellipses from fitting it again
+    if radius <= 0.5 and error < tolerance * radius:
+        polyline.classified = True
+
+    # Check if it's a good fit (error relative to radius)
+    if not (radius > 0.5 and error < tolerance * radius):
+        return False
+
+    xy = _points_xy(polyline.points)
+
+    # Determine if it's a full circle or arc
+    is_full_circle = _is_full_circle(xy, center, radius)
+
+    if is_full_circle and polyline.closed:
+        # Full circle
+        data.circles.append(Circle(
+            center=Point(center[0], center[1]),
+            radius=radius,
+            color=polyline.color,
+            width=polyline.width,
+            layer=polyline.layer,
+            linetype=polyline.linetype
+        ))
+    else:
+        # Arc
+        start_angle, end_angle = _calculate_arc_angles(
+            center, polyline.points[0], polyline.points[-1]
+        )
+        # Ensure proper arc direction
+        if not _is_ccw(xy, center):
+            start_angle, end_angle = end_angle, start_angle
+
+        data.arcs.append(Arc(
+            center=Point(center[0], center[1]),
+            radius=radius,
+            start_angle=start_angle,
+            end_angle=end_angle,
+            color=polyline.color,
+            width=polyline.width,
+            layer=polyline.layer,
+            linetype=polyline.linetype
+        ))
+    return True
+
+
+def _fit_circles_batched(
+        polylines: List[Polyline]) -> Optional[List[Optional[Tuple[Tuple[float, float], float, float]]]]:
+    """
+    Fit circles to all polylines at once.
+
+    All vertices are flattened into SoA arrays with per-polyline offsets and
+    the same algebraic least-squares fit as _fit_circle is solved for every
+    polyline in one pass, so the per-polyline loop only has to classify.
+
+    Returns:
+        List parallel to polylines holding (center, radius, error), with None
+        for polylines that are too short or degenerate, or None if the batch
+        fit failed
+    """
+    try:
+        import numpy as np
+
+        n_polys = len(polylines)
+        fits: List[Optional[Tuple[Tuple[float, float], float, float]]] = [None] * n_polys
+        if n_polys == 0:
+            return fits
+
+        counts = np.fromiter((len(p.points) for p in polylines), dtype=np.intp, count=n_polys)
+        fit_mask = counts >= 6
+        if not fit_mask.any():
+            return fits
+
+        fit_index = np.flatnonzero(fit_mask)
+        fit_polys = [polylines[i] for i in fit_index]
+        fit_counts = counts[fit_mask]
+        total = int(fit_counts.sum())
+        starts = np.zeros(len(fit_polys), dtype=np.intp)
+        np.cumsum(fit_counts[:-1], out=starts[1:])
+
+        xs = np.fromiter((pt.x for p in fit_polys for pt in p.points), dtype=np.float64, count=total)
+        ys = np.fromiter((pt.y for p in fit_polys for pt in p.points), dtype=np.float64, count=total)
+
+        # Center each polyline for numerical stability
+        mean_x = np.add.reduceat(xs, starts) / fit_counts
+        mean_y = np.add.reduceat(ys, starts) / fit_counts
+        u = xs - np.repeat(mean_x, fit_counts)
+        v = ys - np.repeat(mean_y, fit_counts)
+        z = u * u + v * v
+
+        # Normal equations of z = a*u + b*v + c (sums of u and v are zero)
+        suu = np.add.reduceat(u * u, starts)
+        svv = np.add.reduceat(v * v, starts)
+        suv = np.add.reduceat(u * v, starts)
+        suz = np.add.reduceat(u * z, starts)
+        svz = np.add.reduceat(v * z, starts)
+        sz = np.add.reduceat(z, starts)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            det = suu * svv - suv * suv
+            a = (suz * svv - svz * suv) / det
+            b = (svz * suu - suz * suv) / det
+            cu = a / 2
+            cv = b / 2
+            radius = np.sqrt(sz / fit_counts + cu * cu + cv * cv)
+
+            # RMS distance from the fitted circle
+            dist = np.hypot(u - np.repeat(cu, fit_counts), v - np.repeat(cv, fit_counts))
+            resid = dist - np.repeat(radius, fit_counts)
+            error = np.sqrt(np.add.reduceat(resid * resid, starts) / fit_counts)
+
+        # Degenerate fits are left to _fit_circle
+        valid = (np.isfinite(radius) & np.isfinite(error) & (radius > 0)
+                 & (det > _COLLINEAR_TOLERANCE * (suu + svv) ** 2))
+        cx = (cu + mean_x).tolist()
+        cy = (cv + mean_y).tolist()
+        radius = radius.tolist()
+        error = error.tolist()
+        for j, i in enumerate(fit_index.tolist()):
+            if valid[j]:
+                fits[i] = ((cx[j], cy[j]), radius[j], error[j])
+
+        return fits
+
+    except Exception:
+        return None
+
+
+def _points_xy(points: List[Point]):
+    """
+    Copy points into an (n, 2) float64 array.
+
+    The detectors build this once per candidate polyline and pass it to the
+    fitting and classification helpers, instead of each helper reading the
+    Point attributes again.
+    """
+    import numpy as np
+
+    coords = np.fromiter((c for p in points for c in (p.x, p.y)),
+                         dtype=np.float64, count=2 * len(points))
+    return coords.reshape(-1, 2)
+
+
+def _is_collinear(xs, ys) -> bool:
+    """Check if points (coordinate arrays) lie on a straight line, see _COLLINEAR_TOLERANCE"""
+    u = xs - xs.mean()
+    v = ys - ys.mean()
+    suu = float(u @ u)
+    svv = float(v @ v)
+    suv = float(u @ v)
+    return suu * svv - suv * suv <= _COLLINEAR_TOLERANCE * (suu + svv) ** 2
+
+
+def _likely_conic(xy) -> bool:
+    """
+    Cheap pre-check that points (an (n, 2) array) could lie on a circle or ellipse.
+
+    Rejects points that are (nearly) collinear or that have a deep
+    concavity (a vertex pushed back against the polyline's overall turning
+    direction by more than _CONIC_MAX_CONCAVITY of its extent). Neither can
+    pass the fitting tolerances, so the fit itself can be skipped.
+    """
+    import numpy as np
+
+    if _is_collinear(xy[:, 0], xy[:, 1]):
+        return False
+    size = float((xy.max(axis=0) - xy.min(axis=0)).max())
 
-    # Sort and check coverage
-    angles.sort()
+    # Signed distance of each vertex from the chord joining its neighbours
+    chord = xy[2:] - xy[:-2]
+    offset = xy[1:-1] - xy[:-2]
+    cross = chord[:, 0] * offset[:, 1] - chord[:, 1] * offset[:, 0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        depth = cross / np.hypot(chord[:, 0], chord[:, 1])
 
-    # Calculate total angular coverage
-    total_coverage = 0
-    for i in range(len(angles) - 1):
-        gap = angles[i + 1] - angles[i]
-        if gap < math.pi:  # Normal gap
-            total_coverage += gap
+    # Flip so that the dominant turning direction is positive
+    if cross.sum() < 0:
+        depth = -depth
+    return not bool((depth < -_CONIC_MAX_CONCAVITY * size).any())
+
+
+def _angular_coverage(angles) -> float:
+    """Total angle (radians) covered by a set of polar angles, ignoring gaps of pi or more"""
+    import numpy as np
+
+    angles = np.sort(angles)
+    gaps = np.diff(angles)
+    total_coverage = float(gaps[gaps < math.pi].sum())
 
     # Add gap from last to first
-    wrap_gap = (2 * math.pi) - (angles[-1] - angles[0])
+    wrap_gap = (2 * math.pi) - float(angles[-1] - angles[0])
     if wrap_gap < math.pi:
         total_coverage += wrap_gap
 
+    return total_coverage
+
+
+def _is_full_circle(xy, center: Tuple[float, float], radius: float) -> bool:
+    """Check if points (an (n, 2) array) cover a full circle (360 degrees)"""
+    import numpy as np
+
+    if len(xy) < 8:
+        return False
+
+    angles = np.arctan2(xy[:, 1] - center[1], xy[:, 0] - center[0])
+
     # Should cover at least 90% of the circle
-    return total_coverage > 0.9 * 2 * math.pi
+    return _angular_coverage(angles) > 0.9 * 2 * math.pi
 
 
-def _is_ccw(points: List[Point], center: Tuple[float, float]) -> bool:
-    """Determine if points are arranged counter-clockwise around center"""
-    if len(points) < 3:
+def _is_ccw(xy, center: Tuple[float, float]) -> bool:
+    """Determine if points (an (n, 2) array) run counter-clockwise around center"""
+    if len(xy) < 3:
         return True
 
     # Calculate signed area
-    signed_area = 0
-    for i in range(len(points) - 1):
-        p1 = points[i]
-        p2 = points[i + 1]
-        signed_area += (p1.x - center[0]) * (p2.y - center[1])
-        signed_area -= (p2.x - center[0]) * (p1.y - center[1])
+    u = xy[:, 0] - center[0]
+    v = xy[:, 1] - center[1]
+    signed_area = float((u[:-1] * v[1:] - u[1:] * v[:-1]).sum())
 
     return signed_area > 0
 
@@ -1264,15 +1882,19 @@ def _fit_circle(points: List[Point]) -> Optional[Tuple[Tuple[float, float], floa
         if n < 3:
             return None
 
-        # Build matrices for least squares
-        A = np.zeros((n, 3))
-        b = np.zeros(n)
+        xs = np.fromiter((p.x for p in points), dtype=np.float64, count=n)
+        ys = np.fromiter((p.y for p in points), dtype=np.float64, count=n)
 
-        for i, p in enumerate(points):
-            A[i, 0] = p.x
-            A[i, 1] = p.y
-            A[i, 2] = 1
-            b[i] = p.x * p.x + p.y * p.y
+        # Straight runs only fit as huge, meaningless circles
+        if _is_collinear(xs, ys):
+            return None
+
+        # Build matrices for least squares
+        A = np.empty((n, 3))
+        A[:, 0] = xs
+        A[:, 1] = ys
+        A[:, 2] = 1.0
+        b = xs * xs + ys * ys
 
         # Solve least squares
         result, residuals, rank, s = np.linalg.lstsq(A, b, rcond=None)
@@ -1288,14 +1910,10 @@ def _fit_circle(points: List[Point]) -> Optional[Tuple[Tuple[float, float], floa
         radius = math.sqrt(r_squared)
 
         # Calculate fitting error (RMS distance from circle)
-        errors = []
-        for p in points:
-            dist = math.sqrt((p.x - cx)**2 + (p.y - cy)**2)
-            errors.append((dist - radius) ** 2)
-
-        rms_error = math.sqrt(sum(errors) / len(errors))
+        dist = np.hypot(xs - cx, ys - cy)
+        rms_error = math.sqrt(float(np.mean((dist - radius) ** 2)))
 
-        return ((cx, cy), radius, rms_error)
+        return ((float(cx), float(cy)), radius, rms_error)
 
     except Exception:
         return None
@@ -1326,73 +1944,96 @@ def detect_ellipses(data: ExtractedData, tolerance: float = 0.05):
         data: ExtractedData to process
         tolerance: Tolerance for ellipse detection (relative to axes)
     """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return  # Ellipse fitting needs NumPy
+
     new_polylines = []
 
     for polyline in data.polylines:
-        # Need at least 6 points to fit an ellipse (5 parameters)
-        if len(polyline.points) < 8:
+        if not _convert_ellipse(data, polyline, tolerance):
             new_polylines.append(polyline)
-            continue
 
-        # Skip if already detected as circle
-        result = _fit_ellipse(polyline.points)
-        if result:
-            center, major_axis, minor_axis, rotation, error = result
+    data.polylines = new_polylines
 
-            # Check if it's a good fit
-            major_len = math.sqrt(major_axis[0]**2 + major_axis[1]**2)
-            if major_len > 0.5 and error < tolerance * major_len:
-                # Check if it's more like a circle (use circle instead)
-                ratio = minor_axis[0]**2 + minor_axis[1]**2
-                ratio = math.sqrt(ratio) / major_len if major_len > 0 else 0
 
-                if ratio > 0.95:  # Nearly circular, skip (detected by circle detector)
-                    new_polylines.append(polyline)
-                    continue
+def _convert_ellipse(data: ExtractedData, polyline: Polyline, tolerance: float) -> bool:
+    """
+    Append polyline to data as an ellipse or elliptical arc if it fits one.
 
-                # Determine if full ellipse or partial
-                is_full = _is_full_ellipse(polyline.points, center, major_axis, minor_axis)
-
-                if is_full and polyline.closed:
-                    # Full ellipse
-                    data.ellipses.append(Ellipse(
-                        center=Point(center[0], center[1]),
-                        major_axis=Point(major_axis[0], major_axis[1]),
-                        ratio=ratio,
-                        start_param=0.0,
-                        end_param=2 * math.pi,
-                        color=polyline.color,
-                        width=polyline.width,
-                        layer=polyline.layer,
-                        linetype=polyline.linetype
-                    ))
-                else:
-                    # Elliptical arc - calculate parameters
-                    start_param, end_param = _calculate_ellipse_params(
-                        center, major_axis, minor_axis, rotation,
-                        polyline.points[0], polyline.points[-1]
-                    )
-                    data.ellipses.append(Ellipse(
-                        center=Point(center[0], center[1]),
-                        major_axis=Point(major_axis[0], major_axis[1]),
-                        ratio=ratio,
-                        start_param=start_param,
-                        end_param=end_param,
-                        color=polyline.color,
-                        width=polyline.width,
-                        layer=polyline.layer,
-                        linetype=polyline.linetype
-                    ))
-                continue
+    Args:
+        data: ExtractedData receiving the ellipse
+        polyline: Candidate polyline
+        tolerance: Tolerance for ellipse detection (relative to axes)
 
-        new_polylines.append(polyline)
+    Returns:
+        True if the polyline was converted
+    """
+    # Need at least 6 points to fit an ellipse (5 parameters)
+    if len(polyline.points) < 8:
+        return False
 
-    data.polylines = new_polylines
+    # Skip if already classified by the circle detector
+    if polyline.classified:
+        return False
+
+    xy = _points_xy(polyline.points)
+    if not _likely_conic(xy):
+        return False
+
+    result = _fit_ellipse(xy)
+    if not result:
+        return False
 
+    center, major_axis, minor_axis, rotation, error = result
 
-def _fit_ellipse(points: List[Point]) -> Optional[Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float], float, float]]:
+    # Check if it's a good fit. Near-collinear points are fitted by
+    # needle-thin ellipses far larger than the points themselves,
+    # which the relative error test alone would accept.
+    major_len = math.sqrt(major_axis[0]**2 + major_axis[1]**2)
+    size = float((xy.max(axis=0) - xy.min(axis=0)).max())
+    if not (major_len > 0.5 and error < tolerance * major_len
+            and major_len <= _MAX_ELLIPSE_OVERHANG * size):
+        return False
+
+    # Check if it's more like a circle (use circle instead)
+    ratio = minor_axis[0]**2 + minor_axis[1]**2
+    ratio = math.sqrt(ratio) / major_len if major_len > 0 else 0
+
+    if ratio > 0.95:  # Nearly circular, skip (detected by circle detector)
+        return False
+
+    # Determine if full ellipse or partial
+    is_full = _is_full_ellipse(xy, center, major_axis, minor_axis)
+
+    if is_full and polyline.closed:
+        # Full ellipse
+        start_param, end_param = 0.0, 2 * math.pi
+    else:
+        # Elliptical arc - calculate parameters
+        start_param, end_param = _calculate_ellipse_params(
+            center, major_axis, minor_axis, rotation,
+            polyline.points[0], polyline.points[-1]
+        )
+
+    data.ellipses.append(Ellipse(
+        center=Point(center[0], center[1]),
+        major_axis=Point(major_axis[0], major_axis[1]),
+        ratio=ratio,
+        start_param=start_param,
+        end_param=end_param,
+        color=polyline.color,
+        width=polyline.width,
+        layer=polyline.layer,
+        linetype=polyline.linetype
+    ))
+    return True
+
+
+def _fit_ellipse(xy) -> Optional[Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float], float, float]]:
     """
-    Fit an ellipse to a set of points using algebraic fitting.
+    Fit an ellipse to points (an (n, 2) array) using algebraic fitting.
 
     Returns:
         Tuple of (center, major_axis, minor_axis, rotation, error) or None if fit fails
@@ -1400,38 +2041,41 @@ def _fit_ellipse(points: List[Point]) -> Optional[Tuple[Tuple[float, float], Tup
     try:
         import numpy as np
 
-        n = len(points)
+        n = len(xy)
         if n < 6:
             return None
 
         # Extract coordinates
-        x = np.array([p.x for p in points])
-        y = np.array([p.y for p in points])
+        x = xy[:, 0]
+        y = xy[:, 1]
 
-        # Build design matrix for conic: ax^2 + bxy + cy^2 + dx + ey + f = 0
+        # Fit the conic ax^2 + bxy + cy^2 + dx + ey + f = 0 subject to
+        # 4ac - b^2 = 1 (Fitzgibbon), in the reduced 3x3 form of Halir and
+        # Flusser: split the scatter matrix into quadratic and linear blocks
         D = np.column_stack([x*x, x*y, y*y, x, y, np.ones(n)])
-
-        # Constraint matrix for ellipse (b^2 - 4ac < 0)
-        C = np.zeros((6, 6))
-        C[0, 2] = 2
-        C[1, 1] = -1
-        C[2, 0] = 2
-
-        # Solve generalized eigenvalue problem
         S = D.T @ D
+        S1 = S[:3, :3]
+        S2 = S[:3, 3:]
+        S3 = S[3:, 3:]
         try:
-            # Use svd for better numerical stability
-            eigvals, eigvecs = np.linalg.eig(np.linalg.inv(S) @ C)
+            T = -np.linalg.solve(S3, S2.T)
         except np.linalg.LinAlgError:
             return None
 
-        # Find the positive eigenvalue (corresponds to ellipse)
-        valid_idx = np.where(np.logical_and(np.isreal(eigvals), eigvals > 0))[0]
+        # Premultiply by the inverse of the 3x3 constraint matrix
+        M = S1 + S2 @ T
+        M = np.array([M[2] / 2, -M[1], M[0] / 2])
+        eigvals, eigvecs = np.linalg.eig(M)
+        eigvecs = eigvecs.real
+
+        # The ellipse is the eigenvector that satisfies the constraint
+        cond = 4 * eigvecs[0] * eigvecs[2] - eigvecs[1] ** 2
+        valid_idx = np.flatnonzero(cond > 0)
         if len(valid_idx) == 0:
             return None
 
-        idx = valid_idx[np.argmin(eigvals[valid_idx].real)]
-        coeffs = eigvecs[:, idx].real
+        a1 = eigvecs[:, valid_idx[0]]
+        coeffs = np.concatenate([a1, T @ a1])
 
         a, b, c, d, e, f = coeffs
 
@@ -1475,29 +2119,24 @@ def _fit_ellipse(points: List[Point]) -> Optional[Tuple[Tuple[float, float], Tup
         semi_major = math.sqrt(max(a_sq, b_sq))
         semi_minor = math.sqrt(min(a_sq, b_sq))
 
-        # Major axis direction
-        if a_sq >= b_sq:
-            major_axis = (semi_major * cos_t, semi_major * sin_t)
-            minor_axis = (-semi_minor * sin_t, semi_minor * cos_t)
-        else:
-            major_axis = (semi_major * sin_t, -semi_major * cos_t)
-            minor_axis = (semi_minor * cos_t, semi_minor * sin_t)
-
-        # Calculate fitting error
-        errors = []
-        for p in points:
-            # Distance to ellipse (approximate)
-            dx = p.x - cx
-            dy = p.y - cy
-            # Rotate to ellipse frame
-            px = dx * cos_t + dy * sin_t
-            py = -dx * sin_t + dy * cos_t
-            # Normalized distance
-            if semi_major > 0 and semi_minor > 0:
-                dist = abs((px/semi_major)**2 + (py/semi_minor)**2 - 1)
-                errors.append(dist * min(semi_major, semi_minor))
-
-        rms_error = math.sqrt(sum(e*e for e in errors) / len(errors)) if errors else float('inf')
+        # Turn the frame so that theta runs along the major axis; the sign of
+        # the eigenvector decides which axis theta lands on
+        if a_sq < b_sq:
+            theta -= math.pi / 2
+            cos_t, sin_t = sin_t, -cos_t
+
+        major_axis = (semi_major * cos_t, semi_major * sin_t)
+        minor_axis = (-semi_minor * sin_t, semi_minor * cos_t)
+
+        # Calculate fitting error from the approximate distance to the
+        # ellipse, in the ellipse frame
+        dx = x - cx
+        dy = y - cy
+        px = dx * cos_t + dy * sin_t
+        py = -dx * sin_t + dy * cos_t
+        errors = np.abs((px / semi_major) ** 2 + (py / semi_minor) ** 2 - 1) * min(semi_major, semi_minor)
+
+        rms_error = math.sqrt(float(np.mean(errors * errors)))
 
         return ((cx, cy), major_axis, minor_axis, theta, rms_error)
 
@@ -1505,48 +2144,26 @@ def _fit_ellipse(points: List[Point]) -> Optional[Tuple[Tuple[float, float], Tup
         return None
 
 
-def _is_full_ellipse(points: List[Point], center: Tuple[float, float],
+def _is_full_ellipse(xy, center: Tuple[float, float],
                      major_axis: Tuple[float, float], minor_axis: Tuple[float, float]) -> bool:
-    """Check if points cover a full ellipse (360 degrees)"""
-    if len(points) < 10:
+    """Check if points (an (n, 2) array) cover a full ellipse (360 degrees)"""
+    import numpy as np
+
+    if len(xy) < 10:
         return False
 
-    # Calculate angular positions of all points relative to ellipse
-    angles = []
     major_len = math.sqrt(major_axis[0]**2 + major_axis[1]**2)
     if major_len < 1e-10:
         return False
 
-    # Calculate rotation angle
-    theta = math.atan2(major_axis[1], major_axis[0])
-    cos_t = math.cos(-theta)
-    sin_t = math.sin(-theta)
+    # Rotate into the ellipse frame and take angular positions there
+    ux = major_axis[0] / major_len
+    uy = major_axis[1] / major_len
+    rotation = np.array([[ux, uy], [-uy, ux]])
+    px, py = rotation @ (xy - center).T
+    angles = np.arctan2(py, px)
 
-    for p in points:
-        # Transform to ellipse frame
-        dx = p.x - center[0]
-        dy = p.y - center[1]
-        px = dx * cos_t + dy * sin_t
-        py = -dx * sin_t + dy * cos_t
-        angle = math.atan2(py, px)
-        angles.append(angle)
-
-    # Sort and check coverage
-    angles.sort()
-
-    # Calculate total angular coverage
-    total_coverage = 0
-    for i in range(len(angles) - 1):
-        gap = angles[i + 1] - angles[i]
-        if gap < math.pi:
-            total_coverage += gap
-
-    # Add wrap-around gap
-    wrap_gap = (2 * math.pi) - (angles[-1] - angles[0])
-    if wrap_gap < math.pi:
-        total_coverage += wrap_gap
-
-    return total_coverage > 0.85 * 2 * math.pi
+    return _angular_coverage(angles) > 0.85 * 2 * math.pi
 
 
 def _calculate_ellipse_params(center: Tuple[float, float],
@@ -1555,27 +2172,25 @@ def _calculate_ellipse_params(center: Tuple[float, float],
                                rotation: float,
                                start: Point, end: Point) -> Tuple[float, float]:
     """Calculate ellipse parameters for start and end points"""
-    cos_t = math.cos(-rotation)
-    sin_t = math.sin(-rotation)
-
-    # Transform start point
-    dx = start.x - center[0]
-    dy = start.y - center[1]
-    px = dx * cos_t + dy * sin_t
-    py = -dx * sin_t + dy * cos_t
-    start_param = math.atan2(py, px)
-
-    # Transform end point
-    dx = end.x - center[0]
-    dy = end.y - center[1]
-    px = dx * cos_t + dy * sin_t
-    py = -dx * sin_t + dy * cos_t
-    end_param = math.atan2(py, px)
-
-    # Normalize to 0-2pi
-    if start_param < 0:
-        start_param += 2 * math.pi
-    if end_param < 0:
-        end_param += 2 * math.pi
-
-    return start_param, end_param
+    semi_major = math.hypot(major_axis[0], major_axis[1])
+    semi_minor = math.hypot(minor_axis[0], minor_axis[1])
+
+    # Unit vector along the major axis; the minor axis is its CCW normal
+    ux = major_axis[0] / semi_major
+    uy = major_axis[1] / semi_major
+
+    params = []
+    for p in (start, end):
+        dx = p.x - center[0]
+        dy = p.y - center[1]
+        px = dx * ux + dy * uy
+        py = -dx * uy + dy * ux
+        # Eccentric anomaly, as used by DXF ellipse parameters
+        param = math.atan2(py * semi_major, px * semi_minor)
+
+        # Normalize to 0-2pi
+        if param < 0:
+            param += 2 * math.pi
+        params.append(param)
+
+    return params[0], params[1]